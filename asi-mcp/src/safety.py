@@ -16,6 +16,12 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Syntactically valid DNS name with an alphabetic TLD, so it can never parse
+# as an IPv4 address. Targets matching this skip the IP parse attempt.
+_HOSTNAME_RE = re.compile(
+    r"^(?=.{1,253}$)(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}$"
+)
+
 
 class UnauthorizedTargetError(Exception):
     """Raised when a target is not authorized for testing."""
@@ -198,6 +204,19 @@ class SafetyValidator:
         logger.warning(f"Hostname {hostname} is not in authorized domains")
         raise UnauthorizedTargetError(f"Hostname {hostname} is not in authorized domains")
 
+    def _validate_host(self, host: str) -> bool:
+        """Validate a bare host as an IP address or, failing that, a hostname."""
+        # Obvious hostnames go straight to the domain check instead of
+        # raising and catching InvalidTargetError from the IP parse
+        if _HOSTNAME_RE.match(host):
+            return self.validate_hostname(host)
+
+        try:
+            return self.validate_ip(host)
+        except InvalidTargetError:
+            # Not an IP, try as hostname
+            return self.validate_hostname(host)
+
     def validate_target(self, target: str) -> bool:
         """
         Validate any target (IP, hostname, URL, or CIDR range).
@@ -226,12 +245,7 @@ class SafetyValidator:
             hostname = parsed.netloc or parsed.path
             hostname = hostname.split(':')[0]
 
-            # Try as IP
-            try:
-                return self.validate_ip(hostname)
-            except InvalidTargetError:
-                # Not an IP, try as hostname
-                return self.validate_hostname(hostname)
+            return self._validate_host(hostname)
 
         # Try parsing as CIDR range
         if '/' in target:
@@ -243,12 +257,8 @@ class SafetyValidator:
             except ValueError:
                 raise InvalidTargetError(f"Invalid CIDR notation: {target}")
 
-        # Try parsing as IP address
-        try:
-            return self.validate_ip(target)
-        except InvalidTargetError:
-            # Not an IP, try as hostname
-            return self.validate_hostname(target)
+        # Try parsing as IP address, then as hostname
+        return self._validate_host(target)
 
     def validate_command_args(self, args: List[str]) -> bool:
         """
@@ -6,16 +6,81 @@ Allows scans to run in the background without blocking API requests.
 
 import asyncio
 import json
-import uuid
-from datetime import datetime
+import mmap
+import os
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Callable
 from enum import Enum
 
+import yaml
+from sortedcontainers import SortedKeyList
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Webhook delivery settings
+WEBHOOK_WORKERS = 8
+WEBHOOK_CONCURRENCY = 32
+WEBHOOK_MAX_RETRIES = 3
+
+# Jobs kept in memory before the oldest finished ones are evicted
+MAX_JOBS = 50_000
+
+# Concurrent scans per tool when tools.yaml doesn't set max_concurrent
+DEFAULT_TOOL_CONCURRENCY = int(os.getenv('MAX_CONCURRENT_SCANS', '5'))
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _blocking_save(path: str, obj: Any) -> int:
+    """Serialize results and write them to path. Returns the bytes written."""
+    buf = _dumps(obj, indent=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return len(buf)
+
+
+def _loads(buf: memoryview) -> Any:
+    """Parse JSON from a bytes-like buffer, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+
+def _blocking_load(path: str) -> Optional[Dict[str, Any]]:
+    """Parse a memory-mapped results file, or return None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf, \
+                memoryview(buf) as view:
+            return _loads(view)
+    except FileNotFoundError:
+        return None
+
 
 class ScanStatus(str, Enum):
     """Scan status enumeration."""
@@ -26,9 +91,20 @@ class ScanStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+FINISHED_STATUSES = (ScanStatus.COMPLETED, ScanStatus.FAILED, ScanStatus.CANCELLED)
+
 class ScanJob:
     """Represents a background scan job."""
 
+    __slots__ = (
+        'job_id', 'tool_name', 'target', 'arguments', 'webhook_url',
+        '_status', '_status_listener', 'created_at', 'created_at_iso',
+        'started_at', 'started_at_iso', 'completed_at', 'completed_at_iso',
+        'completed_at_ts', 'duration_seconds', 'result', 'result_path',
+        'result_bytes_len', 'persisted', 'webhook_payload_bytes', 'error',
+        'task', '_cached_summary', '_summary_dirty',
+    )
+
     def __init__(
         self,
         job_id: str,
@@ -42,13 +118,51 @@ class ScanJob:
         self.target = target
         self.arguments = arguments
         self.webhook_url = webhook_url
-        self.status = ScanStatus.PENDING
-        self.created_at = datetime.utcnow()
+        self._status = ScanStatus.PENDING
+        self._status_listener: Optional[Callable] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.created_at_iso = self.created_at.isoformat(timespec='seconds')
         self.started_at: Optional[datetime] = None
+        self.started_at_iso: Optional[str] = None
         self.completed_at: Optional[datetime] = None
+        self.completed_at_iso: Optional[str] = None
+        self.completed_at_ts: Optional[float] = None
+        self.duration_seconds: Optional[float] = None
         self.result: Optional[Dict[str, Any]] = None
+        self.result_bytes_len: Optional[int] = None
+        self.result_path: Optional[str] = None
+        self.persisted = False
+        self.webhook_payload_bytes: Optional[bytes] = None
         self.error: Optional[str] = None
         self.task: Optional[asyncio.Task] = None
+        self._cached_summary: Optional[Dict[str, Any]] = None
+        self._summary_dirty = True
+
+    @property
+    def status(self) -> ScanStatus:
+        """Current job status."""
+        return self._status
+
+    @status.setter
+    def status(self, value: ScanStatus):
+        old = self._status
+        self._status = value
+        self._summary_dirty = True
+        if self._status_listener is not None and old is not value:
+            self._status_listener(self, old, value)
+
+    def _mark_started(self):
+        """Record the start time."""
+        self.started_at = datetime.now(timezone.utc)
+        self.started_at_iso = self.started_at.isoformat(timespec='seconds')
+
+    def _mark_completed(self):
+        """Record the completion time and the values derived from it."""
+        self.completed_at = datetime.now(timezone.utc)
+        self.completed_at_iso = self.completed_at.isoformat(timespec='seconds')
+        self.completed_at_ts = time.time()
+        if self.started_at:
+            self.duration_seconds = (self.completed_at - self.started_at).total_seconds()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -58,32 +172,83 @@ class ScanJob:
             "target": self.target,
             "arguments": self.arguments,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "duration_seconds": (
-                (self.completed_at - self.started_at).total_seconds()
-                if self.completed_at and self.started_at else None
-            ),
+            "created_at": self.created_at_iso,
+            "started_at": self.started_at_iso,
+            "completed_at": self.completed_at_iso,
+            "duration_seconds": self.duration_seconds,
             "error": self.error
         }
 
     def get_summary(self) -> Dict[str, Any]:
         """Get job summary without full results."""
-        summary = self.to_dict()
-        if self.result:
-            summary["has_results"] = True
-            summary["result_size"] = len(str(self.result))
-        return summary
+        # Status transitions update the other fields without yielding to the
+        # event loop, so invalidating on status change keeps the cache fresh
+        if self._summary_dirty:
+            summary = self.to_dict()
+            if self.result or self.persisted:
+                summary["has_results"] = True
+                summary["result_size"] = self.result_bytes_len
+            self._cached_summary = summary
+            self._summary_dirty = False
+        return self._cached_summary
+
+
+def _newest_first(job: ScanJob) -> float:
+    """Sort key ordering jobs by creation time, newest first."""
+    return -job.created_at.timestamp()
+
+
+def _webhook_body(job: ScanJob, results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the webhook payload for a finished job."""
+    return {
+        "job_id": job.job_id,
+        "tool": job.tool_name,
+        "target": job.target,
+        "status": job.status.value,
+        "completed_at": job.completed_at_iso,
+        "duration_seconds": job.duration_seconds,
+        "results": results
+    }
 
 
 class ScanManager:
     """Manages background scan jobs."""
 
-    def __init__(self, results_dir: str = "/tmp/scans"):
+    def __init__(
+        self,
+        results_dir: str = "/tmp/scans",
+        max_jobs: int = MAX_JOBS,
+        tool_limits: Optional[Dict[str, int]] = None,
+        default_tool_limit: int = DEFAULT_TOOL_CONCURRENCY
+    ):
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
-        self.jobs: Dict[str, ScanJob] = {}
+        # Plain string prefix so per-job paths don't allocate Path objects
+        self._results_dir_str = str(self.results_dir) + os.sep
+        # Insertion order is creation order, which list_jobs and eviction rely on
+        self.jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self.max_jobs = max_jobs
+
+        # Per-tool caps on concurrently running scans
+        self.tool_limits = tool_limits or {}
+        self.default_tool_limit = default_tool_limit
+        self._tool_sems: Dict[str, asyncio.Semaphore] = {}
+
+        # Secondary indices so list_jobs only touches matching jobs
+        self._by_status: Dict[ScanStatus, SortedKeyList] = {
+            status: SortedKeyList(key=_newest_first) for status in ScanStatus
+        }
+        self._by_tool: Dict[str, SortedKeyList] = {}
+
+        # Keep-alive HTTP session shared by all webhook calls, created lazily
+        self._session = None
+        self._session_lock = asyncio.Lock()
+
+        # Webhooks are delivered by worker tasks so slow endpoints don't hold up jobs
+        self._webhook_queue: asyncio.Queue = asyncio.Queue()
+        self._webhook_sem = asyncio.Semaphore(WEBHOOK_CONCURRENCY)
+        self._webhook_workers: List[asyncio.Task] = []
+
         logger.info(f"ScanManager initialized with results dir: {self.results_dir}")
 
     def create_job(
@@ -94,9 +259,13 @@ class ScanManager:
         webhook_url: Optional[str] = None
     ) -> str:
         """Create a new scan job and return job ID."""
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
         job = ScanJob(job_id, tool_name, target, arguments, webhook_url)
         self.jobs[job_id] = job
+        self._index(job)
+
+        if len(self.jobs) > self.max_jobs:
+            self._evict_oldest()
 
         logger.info(f"Created scan job {job_id}: {tool_name} -> {target}")
 
@@ -115,37 +284,58 @@ class ScanManager:
         job = self.jobs[job_id]
 
         try:
-            job.status = ScanStatus.RUNNING
-            job.started_at = datetime.utcnow()
+            # Jobs stay pending until their tool has a free slot
+            async with self._tool_semaphore(job.tool_name):
+                job.status = ScanStatus.RUNNING
+                job._mark_started()
 
-            logger.info(f"Starting scan job {job_id}: {job.tool_name}")
+                logger.info(f"Starting scan job {job_id}: {job.tool_name}")
 
-            # Execute the tool handler
-            result = await tool_handler(**job.arguments)
+                # Execute the tool handler
+                result = await tool_handler(**job.arguments)
 
             job.status = ScanStatus.COMPLETED
-            job.completed_at = datetime.utcnow()
+            job._mark_completed()
             job.result = result
 
+            # Evicting the job unlinks its results file, so the webhook body
+            # is built while the results are still in memory
+            if job.webhook_url:
+                job.webhook_payload_bytes = _dumps(_webhook_body(job, result))
+
             # Save results to file
-            self._save_results(job_id, result)
+            await self._save_results(job)
 
             logger.info(
                 f"Completed scan job {job_id} in "
-                f"{(job.completed_at - job.started_at).total_seconds():.2f}s"
+                f"{job.duration_seconds:.2f}s"
             )
 
-            # Call webhook if configured
+            # Queue webhook delivery if configured
             if job.webhook_url:
-                await self._call_webhook(job)
+                if not self._webhook_workers:
+                    await self.start()
+                self._webhook_queue.put_nowait((job, 0))
 
         except Exception as e:
             job.status = ScanStatus.FAILED
-            job.completed_at = datetime.utcnow()
+            job._mark_completed()
             job.error = str(e)
 
             logger.error(f"Scan job {job_id} failed: {e}", exc_info=True)
 
+    def _tool_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a tool, creating it on first use."""
+        sem = self._tool_sems.get(tool_name)
+        if sem is None:
+            # tools.yaml keys tools by the first part of the name (nmap_scan -> nmap)
+            limit = self.tool_limits.get(
+                tool_name,
+                self.tool_limits.get(tool_name.split("_")[0], self.default_tool_limit)
+            )
+            sem = self._tool_sems[tool_name] = asyncio.Semaphore(limit)
+        return sem
+
     def start_job(
         self,
         job_id: str,
@@ -172,7 +362,7 @@ class ScanManager:
             return None
         return job.get_summary()
 
-    def get_job_results(self, job_id: str) -> Optional[Dict[str, Any]]:
+    async def get_job_results(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get full job results."""
         job = self.get_job(job_id)
         if not job:
@@ -185,31 +375,19 @@ class ScanManager:
                 "message": "Job not completed yet"
             }
 
-        # Try to load from file first
-        results = self._load_results(job_id)
-        if results:
-            return {
-                "job_id": job_id,
-                "status": job.status.value,
-                "tool": job.tool_name,
-                "target": job.target,
-                "completed_at": job.completed_at.isoformat(),
-                "duration_seconds": (job.completed_at - job.started_at).total_seconds(),
-                "results": results
-            }
+        # Results still in memory are served directly; persisted ones from disk
+        results = job.result
+        if results is None and job.persisted:
+            results = await self._load_results(job)
 
-        # Fall back to in-memory results
         return {
             "job_id": job_id,
             "status": job.status.value,
             "tool": job.tool_name,
             "target": job.target,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "duration_seconds": (
-                (job.completed_at - job.started_at).total_seconds()
-                if job.completed_at and job.started_at else None
-            ),
-            "results": job.result
+            "completed_at": job.completed_at_iso,
+            "duration_seconds": job.duration_seconds,
+            "results": results
         }
 
     def list_jobs(
@@ -219,23 +397,34 @@ class ScanManager:
         limit: int = 50
     ) -> list[Dict[str, Any]]:
         """List jobs with optional filters."""
-        jobs = list(self.jobs.values())
-
-        # Filter by status
-        if status:
-            jobs = [j for j in jobs if j.status == status]
-
-        # Filter by tool
-        if tool_name:
-            jobs = [j for j in jobs if j.tool_name == tool_name]
-
-        # Sort by creation time (newest first)
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-
-        # Limit results
-        jobs = jobs[:limit]
-
-        return [j.get_summary() for j in jobs]
+        if status and tool_name:
+            # Walk the smaller index and check the other filter inline
+            by_status = self._by_status[status]
+            by_tool = self._by_tool.get(tool_name, ())
+            if len(by_status) <= len(by_tool):
+                jobs = (j for j in by_status if j.tool_name == tool_name)
+            else:
+                jobs = (j for j in by_tool if j.status == status)
+        elif status:
+            jobs = iter(self._by_status[status])
+        elif tool_name:
+            jobs = iter(self._by_tool.get(tool_name, ()))
+        else:
+            # Insertion order is creation order
+            jobs = reversed(self.jobs.values())
+
+        # Indices are already sorted newest first
+        return [j.get_summary() for j in islice(jobs, max(limit, 0))]
+
+    def list_jobs_json(
+        self,
+        status: Optional[ScanStatus] = None,
+        tool_name: Optional[str] = None,
+        limit: int = 50
+    ) -> bytes:
+        """List jobs as a serialized {"jobs": [...], "count": n} JSON body."""
+        jobs = self.list_jobs(status=status, tool_name=tool_name, limit=limit)
+        return _dumps({"jobs": jobs, "count": len(jobs)})
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
@@ -250,94 +439,243 @@ class ScanManager:
             job.task.cancel()
 
         job.status = ScanStatus.CANCELLED
-        job.completed_at = datetime.utcnow()
+        job._mark_completed()
 
         logger.info(f"Cancelled scan job {job_id}")
         return True
 
-    def _save_results(self, job_id: str, results: Dict[str, Any]):
-        """Save results to file."""
+    async def _save_results(self, job: ScanJob):
+        """Save results to file without blocking the event loop."""
         try:
-            results_file = self.results_dir / f"{job_id}.json"
-            with open(results_file, 'w') as f:
-                json.dump(results, f, indent=2)
-            logger.info(f"Saved results for job {job_id} to {results_file}")
+            results_file = self._results_dir_str + job.job_id + ".json"
+            job.result_bytes_len = await asyncio.to_thread(
+                _blocking_save, results_file, job.result
+            )
+            if self.jobs.get(job.job_id) is not job:
+                # Evicted while the write was in flight, nothing will read the file
+                job.result = None
+                os.unlink(results_file)
+                return
+            # Serve results from disk from now on instead of holding them in memory
+            job.result_path = results_file
+            job.persisted = True
+            job.result = None
+            # The summary may have been cached while the write was in flight
+            job._summary_dirty = True
+            logger.info(f"Saved results for job {job.job_id} to {results_file}")
         except Exception as e:
-            logger.error(f"Failed to save results for job {job_id}: {e}")
+            logger.error(f"Failed to save results for job {job.job_id}: {e}")
 
-    def _load_results(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Load results from file."""
+    async def _load_results(self, job: ScanJob) -> Optional[Dict[str, Any]]:
+        """Load persisted results from file without blocking the event loop."""
         try:
-            results_file = self.results_dir / f"{job_id}.json"
-            if results_file.exists():
-                with open(results_file, 'r') as f:
-                    return json.load(f)
+            return await asyncio.to_thread(_blocking_load, job.result_path)
         except Exception as e:
-            logger.error(f"Failed to load results for job {job_id}: {e}")
+            logger.error(f"Failed to load results for job {job.job_id}: {e}")
         return None
 
-    async def _call_webhook(self, job: ScanJob):
-        """Call webhook with job results."""
-        if not job.webhook_url:
+    async def _get_session(self):
+        """Get the shared webhook HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    import aiohttp
+
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=100,
+                            keepalive_timeout=60,
+                            ttl_dns_cache=300
+                        )
+                    )
+        return self._session
+
+    async def start(self):
+        """Start the webhook delivery workers."""
+        if self._webhook_workers:
             return
+        self._webhook_workers = [
+            asyncio.create_task(self._webhook_worker())
+            for _ in range(WEBHOOK_WORKERS)
+        ]
+
+    async def close(self):
+        """Stop the webhook workers and close the shared HTTP session."""
+        for worker in self._webhook_workers:
+            worker.cancel()
+        await asyncio.gather(*self._webhook_workers, return_exceptions=True)
+        self._webhook_workers = []
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _webhook_worker(self):
+        """Deliver queued webhooks, re-queueing failures with exponential backoff."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job, attempt = await self._webhook_queue.get()
+            try:
+                async with self._webhook_sem:
+                    delivered = await self._call_webhook(job)
+
+                if not delivered and attempt < WEBHOOK_MAX_RETRIES:
+                    delay = 2 ** attempt
+                    logger.info(
+                        f"Retrying webhook for job {job.job_id} in {delay}s "
+                        f"(attempt {attempt + 1}/{WEBHOOK_MAX_RETRIES})"
+                    )
+                    loop.call_later(
+                        delay, self._webhook_queue.put_nowait, (job, attempt + 1)
+                    )
+                else:
+                    # Delivered or out of retries, the payload is no longer needed
+                    job.webhook_payload_bytes = None
+            finally:
+                self._webhook_queue.task_done()
+
+    async def _call_webhook(self, job: ScanJob) -> bool:
+        """Call webhook with job results. Returns True if it was delivered."""
+        if not job.webhook_url:
+            return True
 
         try:
             import aiohttp
 
-            payload = {
-                "job_id": job.job_id,
-                "tool": job.tool_name,
-                "target": job.target,
-                "status": job.status.value,
-                "completed_at": job.completed_at.isoformat(),
-                "duration_seconds": (job.completed_at - job.started_at).total_seconds(),
-                "results": job.result
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(job.webhook_url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info(f"Webhook called successfully for job {job.job_id}")
-                    else:
-                        logger.warning(
-                            f"Webhook call failed for job {job.job_id}: "
-                            f"HTTP {response.status}"
-                        )
+            # Serialized once and reused across retries
+            if job.webhook_payload_bytes is None:
+                results = job.result
+                if results is None and job.persisted:
+                    results = await self._load_results(job)
+
+                job.webhook_payload_bytes = _dumps(_webhook_body(job, results))
+
+            session = await self._get_session()
+            async with session.post(
+                job.webhook_url,
+                data=job.webhook_payload_bytes,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if 200 <= response.status < 300:
+                    logger.info(f"Webhook called successfully for job {job.job_id}")
+                    return True
+
+                logger.warning(
+                    f"Webhook call failed for job {job.job_id}: "
+                    f"HTTP {response.status}"
+                )
 
         except Exception as e:
             logger.error(f"Failed to call webhook for job {job.job_id}: {e}")
 
+        return False
+
     def cleanup_old_jobs(self, max_age_hours: int = 24):
         """Clean up old completed jobs."""
-        cutoff = datetime.utcnow().timestamp() - (max_age_hours * 3600)
+        cutoff = time.time() - (max_age_hours * 3600)
 
+        # Only finished jobs are eligible, so walk just those status indices
         jobs_to_remove = [
-            job_id for job_id, job in self.jobs.items()
-            if job.status in [ScanStatus.COMPLETED, ScanStatus.FAILED, ScanStatus.CANCELLED]
-            and job.completed_at
-            and job.completed_at.timestamp() < cutoff
+            job.job_id
+            for status in FINISHED_STATUSES
+            for job in self._by_status[status]
+            if job.completed_at_ts is not None and job.completed_at_ts < cutoff
         ]
 
         for job_id in jobs_to_remove:
-            # Remove results file
-            results_file = self.results_dir / f"{job_id}.json"
-            if results_file.exists():
-                results_file.unlink()
-
             # Remove from memory
-            del self.jobs[job_id]
+            job = self.jobs.pop(job_id)
+            self._unindex(job)
 
         if jobs_to_remove:
+            # Remove results files
+            self._remove_results_files(set(jobs_to_remove))
             logger.info(f"Cleaned up {len(jobs_to_remove)} old jobs")
 
+    def _evict_oldest(self):
+        """Drop the oldest finished job from memory to keep the table bounded."""
+        for job_id, job in self.jobs.items():
+            if job.status in FINISHED_STATUSES:
+                break
+        else:
+            # Everything in memory is still pending or running
+            return
+
+        del self.jobs[job_id]
+        self._unindex(job)
+        # Nothing can look the job up anymore, so its results file goes too
+        if job.result_path:
+            try:
+                os.unlink(job.result_path)
+            except OSError as e:
+                logger.error(f"Failed to remove results file for job {job_id}: {e}")
+        logger.debug(f"Evicted scan job {job_id} from memory")
+
+    def _remove_results_files(self, job_ids: set):
+        """Delete the results files of the given jobs in one directory pass."""
+        try:
+            with os.scandir(self._results_dir_str) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".json") and name[:-5] in job_ids:
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+        except OSError as e:
+            logger.error(f"Failed to remove results files: {e}")
+
+    def _index(self, job: ScanJob):
+        """Add a job to the status and tool indices."""
+        self._by_status[job.status].add(job)
+        if job.tool_name not in self._by_tool:
+            self._by_tool[job.tool_name] = SortedKeyList(key=_newest_first)
+        self._by_tool[job.tool_name].add(job)
+        job._status_listener = self._on_status_change
+
+    def _unindex(self, job: ScanJob):
+        """Remove a job from the status and tool indices."""
+        job._status_listener = None
+        self._by_status[job.status].discard(job)
+        by_tool = self._by_tool.get(job.tool_name)
+        if by_tool is not None:
+            by_tool.discard(job)
+            if not by_tool:
+                del self._by_tool[job.tool_name]
+
+    def _on_status_change(self, job: ScanJob, old: ScanStatus, new: ScanStatus):
+        """Move a job between status indices on a status transition."""
+        self._by_status[old].discard(job)
+        self._by_status[new].add(job)
+
 
 # Global scan manager instance
 _scan_manager: Optional[ScanManager] = None
 
 
+def _load_tool_limits(config_path: str) -> Dict[str, int]:
+    """Read per-tool max_concurrent settings from the tools config file."""
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading tool limits from {config_path}: {e}")
+        return {}
+
+    return {
+        name: int(tool_config['max_concurrent'])
+        for name, tool_config in (config.get('tools') or {}).items()
+        if isinstance(tool_config, dict) and tool_config.get('max_concurrent')
+    }
+
+
 def get_scan_manager() -> ScanManager:
     """Get the global scan manager instance."""
     global _scan_manager
     if _scan_manager is None:
-        _scan_manager = ScanManager()
+        config_path = os.getenv('CONFIG_PATH', '/app/config/tools.yaml')
+        _scan_manager = ScanManager(tool_limits=_load_tool_limits(config_path))
     return _scan_manager
@@ -8,7 +8,7 @@ from typing import Any, Dict, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import mcp.types as types
 from mcp.server import Server
@@ -42,9 +42,13 @@ async def lifespan(app: FastAPI):
     validator = get_validator()
     logger.info(f"Safety validator initialized")
 
+    # Start webhook delivery workers
+    await get_scan_manager().start()
+
     yield
 
     logger.info("MCP Security Server shutting down")
+    await get_scan_manager().close()
 
 
 # Create FastAPI app
@@ -415,7 +419,7 @@ async def start_async_scan(request: Request):
 
     Returns:
     {
-        "job_id": "uuid",
+        "job_id": "32-char hex id",
         "status": "pending",
         "message": "Scan job created"
     }
@@ -455,6 +459,9 @@ async def start_async_scan(request: Request):
             "httpx_scan": "target",
             "hydra_bruteforce": "target",
             "crackmapexec_scan": "target",
+            "nmap_scan_many": "targets",
+            "masscan_scan_many": "targets",
+            "rustscan_scan_many": "targets",
 
             # Web tools - use "url"
             "gobuster_scan": "url",
@@ -468,6 +475,7 @@ async def start_async_scan(request: Request):
             # Domain-based tools - use "domain"
             "subfinder_scan": "domain",
             "theharvester_scan": "domain",
+            "subfinder_scan_many": "domains",
 
             # Binary analysis - use "file_path"
             "strings_analyze": "file_path",
@@ -520,13 +528,13 @@ async def get_scan_status(job_id: str):
 
     Returns:
     {
-        "job_id": "uuid",
+        "job_id": "32-char hex id",
         "tool_name": "nuclei_scan",
         "target": "https://example.com",
         "status": "running|completed|failed",
-        "created_at": "2026-01-14T12:00:00",
-        "started_at": "2026-01-14T12:00:01",
-        "completed_at": "2026-01-14T12:05:00",
+        "created_at": "2026-01-14T12:00:00+00:00",
+        "started_at": "2026-01-14T12:00:01+00:00",
+        "completed_at": "2026-01-14T12:05:00+00:00",
         "duration_seconds": 299.5
     }
     """
@@ -550,7 +558,7 @@ async def get_scan_results(job_id: str):
     otherwise returns the current status.
     """
     scan_manager = get_scan_manager()
-    results = scan_manager.get_job_results(job_id)
+    results = await scan_manager.get_job_results(job_id)
 
     if not results:
         return JSONResponse({
@@ -587,16 +595,14 @@ async def list_scans(
                         f"{', '.join([s.value for s in ScanStatus])}"
             }, status_code=400)
 
-    jobs = scan_manager.list_jobs(
+    # Serialized in one pass by the scan manager
+    payload = scan_manager.list_jobs_json(
         status=status_filter,
         tool_name=tool,
         limit=limit
     )
 
-    return JSONResponse({
-        "jobs": jobs,
-        "count": len(jobs)
-    })
+    return Response(content=payload, media_type="application/json")
 
 
 @app.post("/scans/{job_id}/cancel")
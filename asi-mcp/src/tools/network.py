@@ -7,24 +7,111 @@ autorecon, theharvester, responder, netexec, enum4linux-ng
 
 import asyncio
 import json
+import os
 import subprocess
 import shlex
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import signal
+import sys
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Any, Optional
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
 import mcp.types as types
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout, timeout_at as async_timeout_at
+else:
+    from async_timeout import timeout as async_timeout, timeout_at as async_timeout_at
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 from ..logging_config import get_logger, get_audit_logger
-from ..safety import get_validator, UnauthorizedTargetError, InvalidTargetError
+from ..safety import (
+    get_validator,
+    SafetyValidator,
+    UnauthorizedTargetError,
+    InvalidTargetError
+)
 
 logger = get_logger(__name__)
 audit_logger = get_audit_logger()
 
+_VALIDATOR: Optional[SafetyValidator] = None
+
+# Environment passed to tool processes. Only what the tools need is forwarded,
+# so server secrets such as MCP_TOKEN never reach scanner binaries.
+_SCAN_ENV_NAMES = (
+    "PATH", "HOME", "USER", "LANG", "LC_ALL", "TERM", "TMPDIR", "GOPATH",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy",
+)
+_SCAN_ENV_PREFIXES = ("AWS_", "AZURE_", "ARM_", "GOOGLE_", "CLOUDSDK_")
+_SCAN_ENV = {
+    name: value for name, value in os.environ.items()
+    if name in _SCAN_ENV_NAMES or name.startswith(_SCAN_ENV_PREFIXES)
+}
+
+# Upper bound on targets the *_scan_many tools scan at once
+_CONCURRENCY = asyncio.Semaphore(int(os.getenv('MAX_CONCURRENT_TARGETS', '32')))
+
+# Upper bound on tool processes running at once across all callers, so bursts
+# of scans can't exhaust file descriptors on their pipes
+_EXEC_SEM = asyncio.Semaphore(int(os.getenv('MAX_CONCURRENT_PROCESSES', '16')))
+
+# Buffer limit for tool output pipes. asyncio only pauses reading a pipe once
+# this much is unread, so a chatty tool keeps writing while its output is parsed
+_STREAM_LIMIT = 4 * 1024 * 1024
+
+
+def _validator() -> SafetyValidator:
+    """Return the safety validator, cached on first use."""
+    global _VALIDATOR
+    validator = _VALIDATOR
+    if validator is None:
+        validator = _VALIDATOR = get_validator()
+    return validator
+
+
+def _to_text(data: bytes) -> str:
+    """Decode tool output for fields returned as strings."""
+    return data.decode('utf-8', errors='ignore')
+
+
+async def _spawn(cmd: List[str]) -> asyncio.subprocess.Process:
+    """Start a tool process in its own session with the trimmed environment."""
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_SCAN_ENV,
+        start_new_session=True,
+        limit=_STREAM_LIMIT
+    )
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a tool process along with anything it spawned, then reap it."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
 
 async def execute_command(
     cmd: List[str],
     timeout: int = 300,
-    tool_name: str = "unknown"
+    tool_name: str = "unknown",
+    decode_stdout: bool = True
 ) -> Dict[str, Any]:
     """
     Execute a command with timeout and error handling.
@@ -33,46 +120,42 @@ async def execute_command(
         cmd: Command and arguments as list
         timeout: Timeout in seconds
         tool_name: Name of the tool for logging
+        decode_stdout: Return stdout as str; pass False to get the raw
+            bytes when the caller parses them directly
 
     Returns:
         Dict with stdout, stderr, returncode, and execution time
     """
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
 
     try:
         logger.info(f"Executing {tool_name}: {' '.join(cmd)}")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        async with _EXEC_SEM:
+            process = await _spawn(cmd)
 
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            process.kill()
-            await process.wait()
-            raise TimeoutError(f"{tool_name} execution exceeded {timeout} seconds")
+            try:
+                async with async_timeout(timeout):
+                    stdout, stderr = await process.communicate()
+            except asyncio.TimeoutError:
+                await _kill(process)
+                raise TimeoutError(f"{tool_name} execution exceeded {timeout} seconds")
 
-        duration = (datetime.utcnow() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         return {
-            "stdout": stdout.decode('utf-8', errors='ignore'),
-            "stderr": stderr.decode('utf-8', errors='ignore'),
+            "stdout": _to_text(stdout) if decode_stdout else stdout,
+            "stderr": _to_text(stderr),
             "returncode": process.returncode,
             "duration_seconds": duration,
             "success": process.returncode == 0
         }
 
     except Exception as e:
-        duration = (datetime.utcnow() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.error(f"Error executing {tool_name}: {e}")
         return {
-            "stdout": "",
+            "stdout": "" if decode_stdout else b"",
             "stderr": str(e),
             "returncode": -1,
             "duration_seconds": duration,
@@ -81,6 +164,218 @@ async def execute_command(
         }
 
 
+async def execute_command_streaming(
+    cmd: List[str],
+    timeout: int = 300,
+    tool_name: str = "unknown",
+    status: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Execute a command and yield its stdout in chunks as it is produced.
+
+    Args:
+        cmd: Command and arguments as list
+        timeout: Timeout in seconds
+        tool_name: Name of the tool for logging
+        status: Optional dict filled in once the command finishes with
+            stderr, returncode, execution time and success, using the same
+            keys as execute_command
+
+    Yields:
+        Raw stdout chunks
+    """
+    if status is None:
+        status = {}
+    start_time = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    process = None
+    stderr_task = None
+    acquired = False
+
+    try:
+        logger.info(f"Executing {tool_name}: {' '.join(cmd)}")
+
+        await _EXEC_SEM.acquire()
+        acquired = True
+        deadline = loop.time() + timeout
+
+        process = await _spawn(cmd)
+        # Drain stderr concurrently so a full pipe can't stall the process
+        stderr_task = asyncio.create_task(process.stderr.read())
+
+        try:
+            while True:
+                async with async_timeout_at(deadline):
+                    chunk = await process.stdout.read(65536)
+                if not chunk:
+                    break
+                yield chunk
+
+            async with async_timeout_at(deadline):
+                stderr = await stderr_task
+                await process.wait()
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{tool_name} execution exceeded {timeout} seconds")
+
+        duration = time.perf_counter() - start_time
+        status.update({
+            "stderr": _to_text(stderr),
+            "returncode": process.returncode,
+            "duration_seconds": duration,
+            "success": process.returncode == 0
+        })
+
+    except Exception as e:
+        duration = time.perf_counter() - start_time
+        logger.error(f"Error executing {tool_name}: {e}")
+        status.update({
+            "stderr": str(e),
+            "returncode": -1,
+            "duration_seconds": duration,
+            "success": False,
+            "error": str(e)
+        })
+
+    finally:
+        if process is not None and process.returncode is None:
+            await _kill(process)
+        if stderr_task is not None and not stderr_task.done():
+            stderr_task.cancel()
+        if acquired:
+            _EXEC_SEM.release()
+
+
+def _parse_nmap_port(port_elem) -> Dict[str, Any]:
+    """Convert an nmap <port> element into a port dict."""
+    attrib = port_elem.attrib
+    port_data = {
+        "port": attrib.get("portid"),
+        "protocol": attrib.get("protocol"),
+        "state": None,
+        "service": None
+    }
+
+    for child in port_elem:
+        tag = child.tag
+        if tag == "state":
+            port_data["state"] = child.attrib.get("state")
+        elif tag == "service":
+            service = child.attrib
+            port_data["service"] = {
+                "name": service.get("name"),
+                "product": service.get("product"),
+                "version": service.get("version"),
+                "extrainfo": service.get("extrainfo")
+            }
+
+    return port_data
+
+
+def _parse_nmap_host(host_elem) -> Dict[str, Any]:
+    """Convert an nmap <host> element into a host dict in a single pass."""
+    addresses = []
+    hostnames = []
+    ports = []
+    state = None
+
+    for child in host_elem:
+        tag = child.tag
+        if tag == "address":
+            attrib = child.attrib
+            addresses.append({
+                "addr": attrib.get("addr"),
+                "type": attrib.get("addrtype")
+            })
+        elif tag == "hostnames":
+            for hostname in child:
+                if hostname.tag == "hostname":
+                    attrib = hostname.attrib
+                    hostnames.append({
+                        "name": attrib.get("name"),
+                        "type": attrib.get("type")
+                    })
+        elif tag == "ports":
+            for port in child:
+                if port.tag == "port":
+                    ports.append(_parse_nmap_port(port))
+        elif tag == "status" and state is None:
+            state = child.attrib.get("state")
+
+    return {
+        "addresses": addresses,
+        "hostnames": hostnames,
+        "ports": ports,
+        "state": state
+    }
+
+
+def _nmap_pull_parser():
+    """
+    Create an incremental parser that emits nmap <host> elements.
+
+    Uses lxml when available, falling back to ElementTree.
+    """
+    if lxml_etree is not None:
+        return lxml_etree.XMLPullParser(
+            events=("end",),
+            tag="host",
+            huge_tree=False
+        )
+    return ET.XMLPullParser(events=("end",))
+
+
+def _drain_nmap_hosts(parser, hosts: List[Dict[str, Any]]) -> None:
+    """Convert completed <host> elements from parser and free them."""
+    for _, host_elem in parser.read_events():
+        if host_elem.tag != "host":
+            continue
+
+        hosts.append(_parse_nmap_host(host_elem))
+
+        # Free the parsed host and any preceding siblings
+        host_elem.clear()
+        if lxml_etree is not None:
+            while host_elem.getprevious() is not None:
+                del host_elem.getparent()[0]
+
+
+def _feed_nmap_xml(parser, data: bytes, hosts: List[Dict[str, Any]]) -> None:
+    """Feed a chunk of nmap XML to parser and collect completed hosts."""
+    parser.feed(data)
+    _drain_nmap_hosts(parser, hosts)
+
+
+def _close_nmap_xml(parser, hosts: List[Dict[str, Any]]) -> None:
+    """Finish parsing and collect any remaining hosts."""
+    parser.close()
+    _drain_nmap_hosts(parser, hosts)
+
+
+def _parse_nmap_xml(xml_bytes: bytes) -> List[Dict[str, Any]]:
+    """Parse complete nmap XML output into a list of host dicts."""
+    parser = _nmap_pull_parser()
+    hosts = []
+
+    _feed_nmap_xml(parser, xml_bytes, hosts)
+    _close_nmap_xml(parser, hosts)
+
+    return hosts
+
+
+def iter_jsonl(lines: Iterable[bytes]):
+    """Yield each JSON object from JSONL lines, skipping malformed ones."""
+    loads = orjson.loads if orjson is not None else json.loads
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield loads(line)
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            continue
+
+
 # Tool implementations
 
 async def nmap_scan(
@@ -101,7 +396,7 @@ async def nmap_scan(
     Returns:
         Scan results
     """
-    validator = get_validator()
+    validator = _validator()
 
     try:
         # Validate target
@@ -115,10 +410,12 @@ async def nmap_scan(
 
         if arguments:
             # Parse additional arguments safely
-            validator.validate_command_args(shlex.split(arguments))
-            cmd.extend(shlex.split(arguments))
+            parsed_args = shlex.split(arguments)
+            validator.validate_command_args(parsed_args)
+            cmd.extend(parsed_args)
 
-        cmd.extend(["-oX", "-", target])  # XML output to stdout
+        # XML output to stdout, without the XSL stylesheet reference we never use
+        cmd.extend(["-oX", "-", "--no-stylesheet", target])
 
         # Log execution
         validator.log_tool_execution(
@@ -127,83 +424,57 @@ async def nmap_scan(
             {"scan_type": scan_type, "ports": ports, "arguments": arguments}
         )
 
-        # Execute
-        result = await execute_command(cmd, timeout=600, tool_name="nmap")
-
-        # Parse XML output into structured data
-        import xml.etree.ElementTree as ET
+        # Execute, parsing hosts out of the XML as nmap writes it. Parsing
+        # runs on a dedicated thread (lxml releases the GIL while parsing) so
+        # large outputs don't stall the event loop. The parser stays on that
+        # one thread for its whole life.
+        result = {}
         hosts = []
-
-        if result["success"] and result["stdout"]:
-            try:
-                root = ET.fromstring(result["stdout"])
-
-                # Parse each host
-                for host_elem in root.findall('.//host'):
-                    host_data = {
-                        "addresses": [],
-                        "hostnames": [],
-                        "ports": [],
-                        "state": None
-                    }
-
-                    # Get addresses
-                    for addr in host_elem.findall('.//address'):
-                        host_data["addresses"].append({
-                            "addr": addr.get("addr"),
-                            "type": addr.get("addrtype")
-                        })
-
-                    # Get hostnames
-                    for hostname in host_elem.findall('.//hostname'):
-                        host_data["hostnames"].append({
-                            "name": hostname.get("name"),
-                            "type": hostname.get("type")
-                        })
-
-                    # Get host state
-                    status = host_elem.find('.//status')
-                    if status is not None:
-                        host_data["state"] = status.get("state")
-
-                    # Get ports
-                    for port in host_elem.findall('.//port'):
-                        port_data = {
-                            "port": port.get("portid"),
-                            "protocol": port.get("protocol"),
-                            "state": None,
-                            "service": None
-                        }
-
-                        state = port.find('state')
-                        if state is not None:
-                            port_data["state"] = state.get("state")
-
-                        service = port.find('service')
-                        if service is not None:
-                            port_data["service"] = {
-                                "name": service.get("name"),
-                                "product": service.get("product"),
-                                "version": service.get("version"),
-                                "extrainfo": service.get("extrainfo")
-                            }
-
-                        host_data["ports"].append(port_data)
-
-                    hosts.append(host_data)
-
-            except Exception as parse_error:
-                logger.error(f"Error parsing nmap XML: {parse_error}")
-                # Fall back to raw output if parsing fails
-                return {
-                    "tool": "nmap",
-                    "target": target,
-                    "scan_type": scan_type,
-                    "success": result["success"],
-                    "xml_output": result["stdout"],
-                    "parse_error": str(parse_error),
-                    "duration_seconds": result["duration_seconds"]
-                }
+        parse_error = None
+        # Raw output is kept for the fallback if the XML turns out to be malformed
+        raw = []
+        fed = False
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="nmap-parse") as parse_thread:
+            parser = await loop.run_in_executor(parse_thread, _nmap_pull_parser)
+
+            async for chunk in execute_command_streaming(
+                cmd, timeout=600, tool_name="nmap", status=result
+            ):
+                raw.append(chunk)
+                if parse_error is not None:
+                    continue
+                try:
+                    await loop.run_in_executor(
+                        parse_thread, _feed_nmap_xml, parser, chunk, hosts
+                    )
+                    fed = True
+                except Exception as e:
+                    parse_error = e
+
+            if fed and parse_error is None and result["success"]:
+                try:
+                    await loop.run_in_executor(
+                        parse_thread, _close_nmap_xml, parser, hosts
+                    )
+                except Exception as e:
+                    parse_error = e
+
+        if not result["success"]:
+            hosts = []
+        elif parse_error is not None:
+            logger.error(f"Error parsing nmap XML: {parse_error}")
+            # Fall back to the full raw output
+            return {
+                "tool": "nmap",
+                "target": target,
+                "scan_type": scan_type,
+                "success": result["success"],
+                "xml_output": _to_text(b"".join(raw)),
+                "parse_error": str(parse_error),
+                "duration_seconds": result["duration_seconds"]
+            }
 
         return {
             "tool": "nmap",
@@ -250,7 +521,7 @@ async def masscan_scan(
     Returns:
         Scan results
     """
-    validator = get_validator()
+    validator = _validator()
 
     try:
         validator.validate_target(target)
@@ -308,7 +579,7 @@ async def rustscan_scan(
     Returns:
         Scan results
     """
-    validator = get_validator()
+    validator = _validator()
 
     try:
         validator.validate_target(target)
@@ -359,7 +630,7 @@ async def subfinder_scan(
     Returns:
         Discovered subdomains
     """
-    validator = get_validator()
+    validator = _validator()
 
     try:
         validator.validate_hostname(domain)
@@ -414,19 +685,13 @@ async def nuclei_scan(
     Returns:
         Vulnerability scan results
     """
-    import tempfile
-    import os
-    import json
-
-    validator = get_validator()
-
-    # Create temporary file for JSON results
-    output_file = tempfile.mktemp(suffix=".jsonl", prefix="nuclei_", dir="/tmp")
+    validator = _validator()
 
     try:
         validator.validate_target(target)
 
-        cmd = ["nuclei", "-u", target, "-jsonl", "-o", output_file]
+        # Findings are written to stdout as JSONL; banner and progress go to stderr
+        cmd = ["nuclei", "-u", target, "-jsonl"]
 
         # Use templates if specified, otherwise use profile
         if templates:
@@ -444,26 +709,19 @@ async def nuclei_scan(
             {"templates": templates, "severity": severity, "profile": profile}
         )
 
-        result = await execute_command(cmd, timeout=600, tool_name="nuclei")
-
-        # Read and parse JSONL results
+        # Execute, parsing findings as nuclei reports them
+        result = {}
         findings = []
-        if os.path.exists(output_file):
-            try:
-                with open(output_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                findings.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                continue
-            finally:
-                # Clean up temp file
-                try:
-                    os.remove(output_file)
-                except:
-                    pass
+        partial = b""
+
+        async for chunk in execute_command_streaming(
+            cmd, timeout=600, tool_name="nuclei", status=result
+        ):
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()
+            findings.extend(iter_jsonl(lines))
+
+        findings.extend(iter_jsonl([partial]))
 
         return {
             "tool": "nuclei",
@@ -477,12 +735,6 @@ async def nuclei_scan(
 
     except Exception as e:
         logger.error(f"Nuclei error: {e}")
-        # Clean up on error
-        try:
-            if os.path.exists(output_file):
-                os.remove(output_file)
-        except:
-            pass
         return {
             "tool": "nuclei",
             "target": target,
@@ -507,7 +759,7 @@ async def theharvester_scan(
     Returns:
         OSINT results
     """
-    validator = get_validator()
+    validator = _validator()
 
     try:
         validator.validate_hostname(domain)
@@ -546,6 +798,107 @@ async def theharvester_scan(
         }
 
 
+# Multi-target helpers
+
+async def _scan_many(
+    scan: Callable[..., Awaitable[Dict[str, Any]]],
+    tool: str,
+    target_key: str,
+    targets: List[str],
+    validate: Callable[[str], Any],
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run a single-target scan against many targets concurrently.
+
+    Targets are validated up front; rejected ones get an error result
+    without starting a process. Accepted ones run under the module-wide
+    concurrency limit. Results are returned in the order of targets.
+    """
+    if isinstance(targets, str):
+        # The async scan API passes its single target as a plain string
+        targets = [targets]
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+    pending = []
+
+    for i, target in enumerate(targets):
+        try:
+            validate(target)
+        except Exception as e:
+            logger.error(f"Target validation failed: {e}")
+            results[i] = {
+                "tool": tool,
+                target_key: target,
+                "success": False,
+                "error": str(e)
+            }
+        else:
+            pending.append(i)
+
+    async def run(target: str) -> Dict[str, Any]:
+        async with _CONCURRENCY:
+            return await scan(target, **kwargs)
+
+    scanned = await asyncio.gather(*(run(targets[i]) for i in pending))
+    for i, result in zip(pending, scanned):
+        results[i] = result
+
+    return results
+
+
+async def nmap_scan_many(
+    targets: List[str],
+    scan_type: str = "sV",
+    ports: str = "",
+    arguments: str = ""
+) -> List[Dict[str, Any]]:
+    """Execute nmap_scan against each of targets concurrently."""
+    return await _scan_many(
+        nmap_scan, "nmap", "target", targets,
+        _validator().validate_target,
+        scan_type=scan_type, ports=ports, arguments=arguments
+    )
+
+
+async def masscan_scan_many(
+    targets: List[str],
+    ports: str = "1-1000",
+    rate: int = 1000
+) -> List[Dict[str, Any]]:
+    """Execute masscan_scan against each of targets concurrently."""
+    return await _scan_many(
+        masscan_scan, "masscan", "target", targets,
+        _validator().validate_target,
+        ports=ports, rate=rate
+    )
+
+
+async def rustscan_scan_many(
+    targets: List[str],
+    ports: str = "",
+    ulimit: int = 5000
+) -> List[Dict[str, Any]]:
+    """Execute rustscan_scan against each of targets concurrently."""
+    return await _scan_many(
+        rustscan_scan, "rustscan", "target", targets,
+        _validator().validate_target,
+        ports=ports, ulimit=ulimit
+    )
+
+
+async def subfinder_scan_many(
+    domains: List[str],
+    sources: str = ""
+) -> List[Dict[str, Any]]:
+    """Execute subfinder_scan against each of domains concurrently."""
+    return await _scan_many(
+        subfinder_scan, "subfinder", "domain", domains,
+        _validator().validate_hostname,
+        sources=sources
+    )
+
+
 # MCP Tool definitions
 
 def list_tools() -> List[types.Tool]:
@@ -647,6 +1000,106 @@ def list_tools() -> List[types.Tool]:
                 "required": ["domain"]
             }
         ),
+        types.Tool(
+            name="nmap_scan_many",
+            description="Run nmap_scan against several targets concurrently. Results are returned in the order of targets.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "targets": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "IP addresses, hostnames, or CIDR ranges to scan"
+                    },
+                    "scan_type": {
+                        "type": "string",
+                        "description": "Scan type: sS (SYN), sT (TCP), sV (version), sC (scripts), A (aggressive)",
+                        "default": "sV"
+                    },
+                    "ports": {
+                        "type": "string",
+                        "description": "Port specification (e.g., '80,443' or '1-1000')",
+                        "default": ""
+                    },
+                    "arguments": {
+                        "type": "string",
+                        "description": "Additional nmap arguments",
+                        "default": ""
+                    }
+                },
+                "required": ["targets"]
+            }
+        ),
+        types.Tool(
+            name="masscan_scan_many",
+            description="Run masscan_scan against several targets concurrently. Results are returned in the order of targets.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "targets": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "IP addresses or CIDR ranges"
+                    },
+                    "ports": {
+                        "type": "string",
+                        "description": "Port range (e.g., '1-65535' or '80,443')",
+                        "default": "1-1000"
+                    },
+                    "rate": {
+                        "type": "integer",
+                        "description": "Packets per second",
+                        "default": 1000
+                    }
+                },
+                "required": ["targets"]
+            }
+        ),
+        types.Tool(
+            name="rustscan_scan_many",
+            description="Run rustscan_scan against several targets concurrently. Results are returned in the order of targets.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "targets": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "IP addresses or hostnames"
+                    },
+                    "ports": {
+                        "type": "string",
+                        "description": "Port range (empty for all ports)",
+                        "default": ""
+                    },
+                    "ulimit": {
+                        "type": "integer",
+                        "description": "File descriptor limit",
+                        "default": 5000
+                    }
+                },
+                "required": ["targets"]
+            }
+        ),
+        types.Tool(
+            name="subfinder_scan_many",
+            description="Run subfinder_scan against several domains concurrently. Results are returned in the order of domains.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "domains": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Target domains"
+                    },
+                    "sources": {
+                        "type": "string",
+                        "description": "Comma-separated list of sources",
+                        "default": ""
+                    }
+                },
+                "required": ["domains"]
+            }
+        ),
         types.Tool(
             name="nuclei_scan",
             description="Fast vulnerability scanner using the pentest profile by default. Detects CVEs, misconfigurations, and security issues.",
@@ -712,4 +1165,8 @@ def get_tools() -> List[Dict[str, Any]]:
         {"name": "subfinder_scan", "handler": subfinder_scan},
         {"name": "nuclei_scan", "handler": nuclei_scan},
         {"name": "theharvester_scan", "handler": theharvester_scan},
+        {"name": "nmap_scan_many", "handler": nmap_scan_many},
+        {"name": "masscan_scan_many", "handler": masscan_scan_many},
+        {"name": "rustscan_scan_many", "handler": rustscan_scan_many},
+        {"name": "subfinder_scan_many", "handler": subfinder_scan_many},
     ]
@@ -14,7 +14,7 @@ import mcp.types as types
 
 from ..logging_config import get_logger
 from ..safety import get_validator, UnauthorizedTargetError, InvalidTargetError
-from .network import execute_command
+from .network import execute_command, iter_jsonl
 
 logger = get_logger(__name__)
 
@@ -647,8 +647,6 @@ async def gospider_scan(
     Returns:
         Discovered URLs and resources
     """
-    import json
-
     validator = get_validator()
 
     try:
@@ -682,27 +680,21 @@ async def gospider_scan(
             }
         )
 
-        result = await execute_command(cmd, timeout=300, tool_name="gospider")
+        result = await execute_command(
+            cmd, timeout=300, tool_name="gospider", decode_stdout=False
+        )
 
         # Parse JSON Lines output from stdout
         findings = []
         urls = set()  # Track unique URLs
 
-        # Gospider with --json outputs JSON Lines to stdout
-        stdout = result.get("stdout", "")
-        for line in stdout.split('\n'):
-            line = line.strip()
-            if line:
-                try:
-                    data = json.loads(line)
-                    findings.append(data)
+        # Gospider with --json outputs JSON Lines to stdout; non-JSON lines are skipped
+        for data in iter_jsonl(result["stdout"].splitlines()):
+            findings.append(data)
 
-                    # Extract URL for unique count
-                    if "output" in data:
-                        urls.add(data["output"])
-                except json.JSONDecodeError:
-                    # Skip non-JSON lines
-                    continue
+            # Extract URL for unique count
+            if "output" in data:
+                urls.add(data["output"])
 
         # Categorize findings by type
         categorized = {
@@ -0,0 +1,345 @@
+"""Tests for network tool execution and output parsing."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.tools import network
+
+
+NMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<nmaprun scanner="nmap" args="nmap -sV -oX - 192.168.1.1">
+<host starttime="1" endtime="2">
+<status state="up" reason="arp-response"/>
+<address addr="192.168.1.1" addrtype="ipv4"/>
+<address addr="00:11:22:33:44:55" addrtype="mac"/>
+<hostnames><hostname name="router.lan" type="PTR"/></hostnames>
+<ports>
+<extraports state="closed" count="998"/>
+<port protocol="tcp" portid="22"><state state="open" reason="syn-ack"/><service name="ssh" product="OpenSSH" version="9.6" extrainfo="protocol 2.0"/></port>
+<port protocol="tcp" portid="80"><state state="open" reason="syn-ack"/></port>
+</ports>
+</host>
+<host><status state="down"/><address addr="192.168.1.2" addrtype="ipv4"/></host>
+<runstats><finished time="2"/><hosts up="1" down="1" total="2"/></runstats>
+</nmaprun>
+"""
+
+
+class TestParseNmapXml:
+    """Test suite for nmap XML parsing."""
+
+    def test_parse_hosts(self):
+        """Test hosts, addresses, hostnames and ports are extracted."""
+        hosts = network._parse_nmap_xml(NMAP_XML)
+
+        assert len(hosts) == 2
+        host = hosts[0]
+        assert host["state"] == "up"
+        assert host["addresses"] == [
+            {"addr": "192.168.1.1", "type": "ipv4"},
+            {"addr": "00:11:22:33:44:55", "type": "mac"},
+        ]
+        assert host["hostnames"] == [{"name": "router.lan", "type": "PTR"}]
+        assert host["ports"] == [
+            {
+                "port": "22",
+                "protocol": "tcp",
+                "state": "open",
+                "service": {
+                    "name": "ssh",
+                    "product": "OpenSSH",
+                    "version": "9.6",
+                    "extrainfo": "protocol 2.0",
+                },
+            },
+            {"port": "80", "protocol": "tcp", "state": "open", "service": None},
+        ]
+        assert hosts[1] == {
+            "addresses": [{"addr": "192.168.1.2", "type": "ipv4"}],
+            "hostnames": [],
+            "ports": [],
+            "state": "down",
+        }
+
+    def test_parse_without_lxml(self, monkeypatch):
+        """Test the ElementTree fallback produces the same result."""
+        expected = network._parse_nmap_xml(NMAP_XML)
+        monkeypatch.setattr(network, "lxml_etree", None)
+
+        assert network._parse_nmap_xml(NMAP_XML) == expected
+
+
+    def test_malformed_xml_raises(self):
+        """Test malformed XML is reported instead of silently recovered."""
+        with pytest.raises(SyntaxError):
+            network._parse_nmap_xml(NMAP_XML.replace(b"</ports>", b"</port>"))
+
+
+class _FakeValidator:
+    """Validator that accepts every target and argument."""
+
+    def validate_target(self, target):
+        pass
+
+    def validate_hostname(self, hostname):
+        pass
+
+    def validate_command_args(self, args):
+        pass
+
+    def log_tool_execution(self, *args, **kwargs):
+        pass
+
+
+class TestNmapScan:
+    """Test suite for the nmap tool."""
+
+    @pytest.fixture(autouse=True)
+    def fake_nmap(self, monkeypatch):
+        """Serve canned nmap output instead of running nmap."""
+        self.chunks = []
+        monkeypatch.setattr(network, "_VALIDATOR", _FakeValidator())
+
+        async def fake_streaming(cmd, timeout=300, tool_name="", status=None):
+            for chunk in self.chunks:
+                yield chunk
+            status.update({
+                "success": True,
+                "stderr": "",
+                "returncode": 0,
+                "duration_seconds": 0.0
+            })
+
+        monkeypatch.setattr(network, "execute_command_streaming", fake_streaming)
+
+    @pytest.mark.asyncio
+    async def test_parses_hosts(self):
+        """Test hosts are parsed from streamed XML."""
+        self.chunks = [NMAP_XML[:200], NMAP_XML[200:]]
+
+        result = await network.nmap_scan("192.168.1.1")
+
+        assert result["hosts_count"] == 2
+        assert result["hosts"] == network._parse_nmap_xml(NMAP_XML)
+
+    @pytest.mark.asyncio
+    async def test_malformed_xml_falls_back_to_raw_output(self):
+        """Test unparseable XML is returned raw with the parse error."""
+        malformed = NMAP_XML.replace(b"</ports>", b"</port>")
+        self.chunks = [malformed[:100], malformed[100:500], malformed[500:]]
+
+        result = await network.nmap_scan("192.168.1.1")
+
+        assert result["success"] is True
+        assert "hosts" not in result
+        assert result["parse_error"]
+        assert result["xml_output"] == malformed.decode()
+
+
+class TestExecuteCommandStreaming:
+    """Test suite for streaming command execution."""
+
+    @pytest.mark.asyncio
+    async def test_streams_stdout_and_reports_status(self):
+        """Test stdout is yielded and stderr/returncode land in status."""
+        status = {}
+        chunks = [
+            chunk async for chunk in network.execute_command_streaming(
+                ["sh", "-c", "printf out; printf err >&2; exit 3"],
+                timeout=10,
+                status=status
+            )
+        ]
+
+        assert b"".join(chunks) == b"out"
+        assert status["stderr"] == "err"
+        assert status["returncode"] == 3
+        assert status["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test a command exceeding its timeout is killed and reported."""
+        status = {}
+        chunks = [
+            chunk async for chunk in network.execute_command_streaming(
+                ["sleep", "5"],
+                timeout=0.2,
+                tool_name="sleep",
+                status=status
+            )
+        ]
+
+        assert chunks == []
+        assert status["success"] is False
+        assert "exceeded" in status["error"]
+
+
+class TestIterJsonl:
+    """Test suite for JSONL result parsing."""
+
+    def test_skips_blank_and_malformed_lines(self):
+        """Test valid objects are returned in order and bad lines skipped."""
+        lines = [b'{"id": 1}', b'', b'  ', b'not json', b'{"id": 2, "info": {"severity": "high"}}']
+
+        assert list(network.iter_jsonl(lines)) == [
+            {"id": 1},
+            {"id": 2, "info": {"severity": "high"}},
+        ]
+
+    def test_without_orjson(self, monkeypatch):
+        """Test the stdlib json fallback."""
+        monkeypatch.setattr(network, "orjson", None)
+
+        assert list(network.iter_jsonl([b'{"id": 1}', b'not json'])) == [{"id": 1}]
+
+
+class TestScanMany:
+    """Test suite for multi-target scan fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_targets_and_keeps_order(self, monkeypatch):
+        """Test rejected targets are not scanned and results keep input order."""
+        scanned = []
+
+        async def fake_scan(target, **kwargs):
+            scanned.append((target, kwargs))
+            return {"tool": "fake", "target": target, "success": True}
+
+        def validate(target):
+            if target == "8.8.8.8":
+                raise network.UnauthorizedTargetError("not authorized")
+
+        results = await network._scan_many(
+            fake_scan, "fake", "target",
+            ["10.0.0.1", "8.8.8.8", "10.0.0.2"],
+            validate,
+            ports="80"
+        )
+
+        assert [r["target"] for r in results] == ["10.0.0.1", "8.8.8.8", "10.0.0.2"]
+        assert results[1] == {
+            "tool": "fake",
+            "target": "8.8.8.8",
+            "success": False,
+            "error": "not authorized"
+        }
+        assert sorted(scanned) == [
+            ("10.0.0.1", {"ports": "80"}),
+            ("10.0.0.2", {"ports": "80"}),
+        ]
+
+
+    def test_many_tools_are_registered(self):
+        """Test every registered handler has a tool definition."""
+        handlers = {tool["name"] for tool in network.get_tools()}
+        schemas = {
+            tool.name: tool.model_dump(by_alias=True)["inputSchema"]
+            for tool in network.list_tools()
+        }
+
+        assert handlers == set(schemas)
+        assert schemas["nmap_scan_many"]["required"] == ["targets"]
+        assert schemas["subfinder_scan_many"]["required"] == ["domains"]
+
+    @pytest.mark.asyncio
+    async def test_handler_scans_each_target(self, monkeypatch):
+        """Test the registered handler passes tool options to every scan."""
+        monkeypatch.setattr(network, "_VALIDATOR", _FakeValidator())
+
+        async def fake_nmap(target, **kwargs):
+            return {"tool": "nmap", "target": target, "success": True, **kwargs}
+
+        monkeypatch.setattr(network, "nmap_scan", fake_nmap)
+        handlers = {tool["name"]: tool["handler"] for tool in network.get_tools()}
+
+        results = await handlers["nmap_scan_many"](
+            targets=["10.0.0.1", "10.0.0.2"], ports="22"
+        )
+
+        assert [r["target"] for r in results] == ["10.0.0.1", "10.0.0.2"]
+        assert all(r["ports"] == "22" and r["scan_type"] == "sV" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_handler_accepts_single_target(self, monkeypatch):
+        """Test a plain string, as sent by the async scan API, is one target."""
+        monkeypatch.setattr(network, "_VALIDATOR", _FakeValidator())
+
+        async def fake_subfinder(domain, **kwargs):
+            return {"tool": "subfinder", "domain": domain, "success": True}
+
+        monkeypatch.setattr(network, "subfinder_scan", fake_subfinder)
+
+        results = await network.subfinder_scan_many("example.com")
+
+        assert results == [{"tool": "subfinder", "domain": "example.com", "success": True}]
+
+
+class TestExecuteCommand:
+    """Test suite for command execution."""
+
+    @pytest.mark.asyncio
+    async def test_environment_is_trimmed(self, monkeypatch):
+        """Test tool processes get PATH but not server secrets."""
+        monkeypatch.setenv("MCP_TOKEN", "sentinel-secret")
+        monkeypatch.setitem(network._SCAN_ENV, "PATH", "/usr/bin:/bin")
+
+        result = await network.execute_command(["env"], timeout=10, tool_name="env")
+
+        assert result["success"]
+        assert "PATH=/usr/bin:/bin" in result["stdout"].splitlines()
+        assert "MCP_TOKEN" not in result["stdout"]
+        assert "sentinel-secret" not in result["stdout"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, tmp_path):
+        """Test a timed-out tool's children are killed with it."""
+        pid_file = tmp_path / "child.pid"
+
+        result = await network.execute_command(
+            ["sh", "-c", f"sleep 60 & echo $! > {pid_file}; wait"],
+            timeout=0.5,
+            tool_name="sleep"
+        )
+
+        assert result["success"] is False
+        assert "exceeded" in result["error"]
+
+        pid = int(pid_file.read_text())
+        # The killed child was orphaned, so init reaps it in its own time
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            await asyncio.sleep(0.05)
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_stdin_is_closed(self):
+        """Test a tool that reads stdin sees EOF instead of waiting on it."""
+        result = await network.execute_command(["cat"], timeout=2, tool_name="cat")
+
+        assert result["success"]
+        assert result["stdout"] == ""
+
+
+class TestProcessLimit:
+    """Test suite for the global tool process limit."""
+
+    @pytest.mark.asyncio
+    async def test_processes_are_bounded(self, monkeypatch):
+        """Test tool processes beyond the limit wait for a free slot."""
+        monkeypatch.setattr(network, "_EXEC_SEM", asyncio.Semaphore(1))
+        start = time.perf_counter()
+
+        results = await asyncio.gather(*(
+            network.execute_command(["sleep", "0.1"], timeout=10) for _ in range(3)
+        ))
+
+        assert all(r["success"] for r in results)
+        assert time.perf_counter() - start >= 0.3
@@ -52,6 +52,20 @@ class TestSafetyValidator:
         assert self.validator.validate_target("http://192.168.1.100") is True
         assert self.validator.validate_target("https://example.com") is True
 
+    def test_validate_target_hostname(self):
+        """Test target validation with hostnames against authorized domains."""
+        self.validator.authorized_domains = ["example.com"]
+
+        assert self.validator.validate_target("sub.example.com") is True
+        assert self.validator.validate_target("https://example.com:8443") is True
+
+        with pytest.raises(UnauthorizedTargetError):
+            self.validator.validate_target("example.org")
+
+        # Dotted numbers are still checked as IPs, not hostnames
+        with pytest.raises(UnauthorizedTargetError):
+            self.validator.validate_target("127.0.0.1")
+
     def test_validate_target_cidr(self):
         """Test target validation with CIDR ranges."""
         assert self.validator.validate_target("192.168.1.0/24") is True
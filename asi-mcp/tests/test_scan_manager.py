@@ -0,0 +1,215 @@
+"""Tests for scan manager module."""
+
+import asyncio
+import json
+
+import pytest
+from src.scan_manager import ScanManager, ScanStatus
+
+
+class TestScanManager:
+    """Test suite for ScanManager."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        """Setup test fixtures."""
+        self.manager = ScanManager(results_dir=str(tmp_path))
+
+    def test_list_jobs_newest_first(self):
+        """Test jobs are listed newest first."""
+        first = self.manager.create_job("nmap_scan", "10.0.0.1", {})
+        second = self.manager.create_job("nmap_scan", "10.0.0.2", {})
+
+        jobs = self.manager.list_jobs()
+        assert [j["job_id"] for j in jobs] == [second, first]
+
+    def test_list_jobs_filters(self):
+        """Test status and tool filters follow status transitions."""
+        nmap_id = self.manager.create_job("nmap_scan", "10.0.0.1", {})
+        nuclei_id = self.manager.create_job("nuclei_scan", "10.0.0.2", {})
+
+        self.manager.get_job(nmap_id).status = ScanStatus.RUNNING
+
+        running = self.manager.list_jobs(status=ScanStatus.RUNNING)
+        assert [j["job_id"] for j in running] == [nmap_id]
+
+        pending = self.manager.list_jobs(status=ScanStatus.PENDING)
+        assert [j["job_id"] for j in pending] == [nuclei_id]
+
+        nuclei = self.manager.list_jobs(tool_name="nuclei_scan")
+        assert [j["job_id"] for j in nuclei] == [nuclei_id]
+
+        assert self.manager.list_jobs(
+            status=ScanStatus.RUNNING, tool_name="nuclei_scan"
+        ) == []
+
+    def test_list_jobs_limit(self):
+        """Test list limit is applied."""
+        for i in range(5):
+            self.manager.create_job("nmap_scan", f"10.0.0.{i}", {})
+
+        assert len(self.manager.list_jobs(limit=3)) == 3
+        assert len(self.manager.list_jobs(tool_name="nmap_scan", limit=2)) == 2
+
+    def test_cleanup_old_jobs_drops_indices(self):
+        """Test cleanup removes jobs from memory and indices."""
+        job_id = self.manager.create_job("nmap_scan", "10.0.0.1", {})
+        assert self.manager.cancel_job(job_id) is True
+
+        self.manager.cleanup_old_jobs(max_age_hours=-1)
+
+        assert self.manager.get_job(job_id) is None
+        assert self.manager.list_jobs(status=ScanStatus.CANCELLED) == []
+        assert self.manager.list_jobs(tool_name="nmap_scan") == []
+
+    def test_summary_refreshed_on_status_change(self):
+        """Test cached summary is invalidated by status transitions."""
+        job_id = self.manager.create_job("nmap_scan", "10.0.0.1", {})
+        assert self.manager.get_job_status(job_id)["status"] == "pending"
+
+        self.manager.cancel_job(job_id)
+        assert self.manager.get_job_status(job_id)["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_execute_job_saves_results(self):
+        """Test completed jobs persist results and report their size."""
+        async def handler(target):
+            return {"target": target, "open_ports": [22, 80]}
+
+        job_id = self.manager.create_job("nmap_scan", "10.0.0.1", {"target": "10.0.0.1"})
+        await self.manager.start_job(job_id, handler)
+
+        status = self.manager.get_job_status(job_id)
+        assert status["status"] == "completed"
+        assert status["has_results"] is True
+        assert status["result_size"] == (self.manager.results_dir / f"{job_id}.json").stat().st_size
+
+        results = await self.manager.get_job_results(job_id)
+        assert results["results"] == {"target": "10.0.0.1", "open_ports": [22, 80]}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_old_jobs_removes_results_files(self):
+        """Test cleanup deletes results files of removed jobs only."""
+        async def handler(target):
+            return {"target": target}
+
+        old_id = self.manager.create_job("nmap_scan", "10.0.0.1", {"target": "10.0.0.1"})
+        await self.manager.start_job(old_id, handler)
+        other = self.manager.results_dir / "unrelated.json"
+        other.write_text("{}")
+
+        self.manager.cleanup_old_jobs(max_age_hours=-1)
+
+        assert not (self.manager.results_dir / f"{old_id}.json").exists()
+        assert other.exists()
+
+    def test_create_job_evicts_oldest_finished(self, tmp_path):
+        """Test the job table stays bounded by evicting finished jobs."""
+        manager = ScanManager(results_dir=str(tmp_path), max_jobs=2)
+        running = manager.create_job("nmap_scan", "10.0.0.1", {})
+        manager.get_job(running).status = ScanStatus.RUNNING
+        finished = manager.create_job("nmap_scan", "10.0.0.2", {})
+        manager.cancel_job(finished)
+
+        newest = manager.create_job("nmap_scan", "10.0.0.3", {})
+
+        assert manager.get_job(finished) is None
+        assert manager.get_job(running) is not None
+        assert [j["job_id"] for j in manager.list_jobs()] == [newest, running]
+
+    @pytest.mark.asyncio
+    async def test_evicted_job_is_not_reused(self, tmp_path):
+        """Test a job evicted mid-save doesn't leak into the next job."""
+        manager = ScanManager(results_dir=str(tmp_path), max_jobs=1)
+
+        async def handler(target):
+            return {"target": target}
+
+        first = manager.create_job("nmap_scan", "10.0.0.1", {"target": "10.0.0.1"})
+        task = manager.start_job(first, handler)
+        # Let the job complete and start saving its results
+        while manager.get_job(first).status != ScanStatus.COMPLETED:
+            await asyncio.sleep(0)
+
+        manager.create_job("nmap_scan", "10.0.0.2", {})
+        third = manager.create_job("nmap_scan", "10.0.0.3", {})
+        await task
+
+        jobs = [manager.get_job(job_id) for job_id in manager.jobs]
+        assert all(job.status == ScanStatus.PENDING for job in jobs)
+        assert all(job.result_path is None and not job.persisted for job in jobs)
+        assert manager.get_job(third).target == "10.0.0.3"
+
+    @pytest.mark.asyncio
+    async def test_evicted_job_results_file_removed(self, tmp_path):
+        """Test eviction deletes the evicted job's results file."""
+        manager = ScanManager(results_dir=str(tmp_path), max_jobs=1)
+
+        async def handler(target):
+            return {"target": target}
+
+        first = manager.create_job("nmap_scan", "10.0.0.1", {"target": "10.0.0.1"})
+        await manager.start_job(first, handler)
+        assert (tmp_path / f"{first}.json").exists()
+
+        manager.create_job("nmap_scan", "10.0.0.2", {})
+
+        assert manager.get_job(first) is None
+        assert not (tmp_path / f"{first}.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_job_evicted_mid_save_leaves_no_file(self, tmp_path):
+        """Test results written after a job was evicted are deleted."""
+        manager = ScanManager(results_dir=str(tmp_path), max_jobs=1)
+
+        async def handler(target):
+            return {"target": target}
+
+        first = manager.create_job(
+            "nmap_scan", "10.0.0.1", {"target": "10.0.0.1"},
+            webhook_url="http://127.0.0.1:9/hook"
+        )
+        task = manager.start_job(first, handler)
+        while manager.get_job(first).status != ScanStatus.COMPLETED:
+            await asyncio.sleep(0)
+        job = manager.get_job(first)
+
+        manager.create_job("nmap_scan", "10.0.0.2", {})
+        await task
+        payload = job.webhook_payload_bytes
+        await manager.close()
+
+        assert list(tmp_path.iterdir()) == []
+        assert job.result is None
+        # The webhook doesn't depend on the deleted file
+        assert b'"target":"10.0.0.1"' in payload.replace(b" ", b"")
+
+    def test_list_jobs_json(self):
+        """Test serialized job listing."""
+        job_id = self.manager.create_job("nmap_scan", "10.0.0.1", {})
+
+        data = json.loads(self.manager.list_jobs_json())
+        assert data["count"] == 1
+        assert data["jobs"][0]["job_id"] == job_id
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_limit(self, tmp_path):
+        """Test jobs beyond a tool's limit stay pending until a slot frees."""
+        manager = ScanManager(results_dir=str(tmp_path), tool_limits={"nmap": 1})
+        release = asyncio.Event()
+
+        async def handler(target):
+            await release.wait()
+            return {"target": target}
+
+        first = manager.create_job("nmap_scan", "10.0.0.1", {"target": "10.0.0.1"})
+        second = manager.create_job("nmap_scan", "10.0.0.2", {"target": "10.0.0.2"})
+        tasks = [manager.start_job(first, handler), manager.start_job(second, handler)]
+        await asyncio.sleep(0)
+
+        assert manager.get_job(first).status == ScanStatus.RUNNING
+        assert manager.get_job(second).status == ScanStatus.PENDING
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert manager.get_job(second).status == ScanStatus.COMPLETED
@@ -4,15 +4,34 @@ author: Brian Fehrman
 version: 0.1
 """
 
+import re
 from pydantic import BaseModel, Field
 from typing import Optional
 
+FILTERED_WORDS = [
+    "system",
+    "prompt",
+    "flag",
+    "key",
+    "instruction",
+    "ignore",
+    "forget",
+]
+
+# Set form of FILTERED_WORDS for the whole-word matching mode
+BANNED_WORDS = frozenset(FILTERED_WORDS)
+WORD_RE = re.compile(r"\w+")
+
 
 class Filter:
     class Valves(BaseModel):
         priority: int = Field(
             default=0, description="Priority level for the filter operations."
         )
+        match_whole_words: bool = Field(
+            default=False,
+            description="Only block banned words appearing as whole words (case-insensitive) instead of as substrings.",
+        )
         pass
 
     def __init__(self):
@@ -24,6 +43,9 @@ class Filter:
         # Initialize 'valves' with specific configurations. Using 'Valves' instance helps encapsulate settings,
         # which ensures settings are managed cohesively and not confused with operational flags like 'file_handler'.
         self.valves = self.Valves()
+
+        # Compile the banned words into one alternation so each message is scanned once
+        self._banned_re = re.compile("|".join(map(re.escape, FILTERED_WORDS)))
         pass
 
     def inlet(self, body: dict, __user__: Optional[dict] = None) -> dict:
@@ -33,19 +55,15 @@ class Filter:
         print(f"inlet:{__name__}")
         print(f"inlet:body:{body}")
         print(f"inlet:user:{__user__}")
-        filtered_words = [
-            "system",
-            "prompt",
-            "flag",
-            "key",
-            "instruction",
-            "ignore",
-            "forget",
-        ]
         if __user__.get("role", "admin") in ["user", "admin"]:
             last_message = body["messages"][-1]["content"]
-            for word in filtered_words:
-                if word in last_message:
-                    raise Exception(f"Banned word detected!")
+            if self.valves.match_whole_words:
+                banned = not BANNED_WORDS.isdisjoint(
+                    WORD_RE.findall(last_message.lower())
+                )
+            else:
+                banned = self._banned_re.search(last_message) is not None
+            if banned:
+                raise Exception(f"Banned word detected!")
 
         return body
@@ -9,25 +9,178 @@ import json
 import sys
 import argparse
 import re
+import functools
+import random
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import os
+import io
+import uuid
+import threading
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Advertise brotli only when urllib3 can decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+# Validators and bodies of ETag-tagged GET responses, kept across runs so
+# repeat setups can revalidate with If-None-Match instead of refetching
+ETAG_CACHE_FILE = Path.home() / ".cache" / "ctf-setup" / "etags.json"
+# The only endpoints whose responses are cached (see APIClient.get_json_cached)
+ETAG_CACHED_ENDPOINTS = ("/api/v1/knowledge/", "/api/v1/auths/admin/config")
+
+# Matches the `self.id = "..."` assignment in a pipeline's source
+PIPELINE_ID_RE = re.compile(r'self\.id\s*=\s*["\']([^"\']+)["\']')
+
+# Shared, read-only extra_headers for the common request shapes
+PRIORITY_HEADERS = MappingProxyType({"Priority": "u=0"})
+LOW_PRIORITY_HEADERS = MappingProxyType({"Priority": "u=4"})
+ANY_PRIORITY_HEADERS = MappingProxyType({"Accept": "*/*", "Priority": "u=0"})
+JSON_HEADERS = MappingProxyType({"Accept": "application/json"})
+# Content-Type None drops any session default for that request only, so
+# requests can set the multipart boundary itself
+MULTIPART_HEADERS = MappingProxyType({"Accept": "*/*", "Priority": "u=0", "Content-Type": None})
+
+# Admin config sent by configure_signups - static fields for Open WebUI v0.7.2+
+SIGNUPS_TEMPLATE = {
+    "SHOW_ADMIN_DETAILS": True,
+    "ENABLE_SIGNUP": True,
+    # API Key settings (v0.7.2 uses plural ENABLE_API_KEYS)
+    "ENABLE_API_KEY": True,
+    "ENABLE_API_KEYS": True,
+    "ENABLE_API_KEY_ENDPOINT_RESTRICTIONS": False,
+    "ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS": False,
+    "API_KEY_ALLOWED_ENDPOINTS": "",
+    "API_KEYS_ALLOWED_ENDPOINTS": "",
+    # User settings
+    "DEFAULT_USER_ROLE": "user",
+    "JWT_EXPIRES_IN": "-1",  # No expiration
+    # Feature flags
+    "ENABLE_COMMUNITY_SHARING": False,
+    "ENABLE_MESSAGE_RATING": False,
+    "ENABLE_USER_WEBHOOKS": False,
+    # UI settings
+    "PENDING_USER_OVERLAY_TITLE": "",
+    "PENDING_USER_OVERLAY_CONTENT": "",
+    "RESPONSE_WATERMARK": "",
+}
+
+# Admin config fields kept from the server's current values, with defaults
+SIGNUPS_PRESERVED = (
+    ("WEBUI_URL", ""),
+    ("DEFAULT_GROUP_ID", ""),
+    ("ENABLE_CHANNELS", False),
+    ("ENABLE_NOTES", False),
+    ("ENABLE_FOLDERS", True),
+    ("ENABLE_MEMORIES", True),
+    ("ENABLE_USER_STATUS", False),
+)
+
+# Capabilities for models that don't specify their own
+DEFAULT_CAPABILITIES = {
+    "vision": False,
+    "file_upload": False,
+    "web_search": False,
+    "image_generation": False,
+    "code_interpreter": False,
+    "citations": False
+}
+
+# Fields each config section's entries must have, and the field naming the
+# source file that has to exist on disk
+CONFIG_REQUIRED_FIELDS = {
+    'users': ('name', 'email', 'password'),
+    'functions': ('id', 'name', 'description', 'content_file'),
+    'tools': ('id', 'name', 'content_file'),
+    'knowledge': ('name',),
+    'models': ('id', 'name', 'base_model_id'),
+    'pipelines': ('name', 'file'),
+}
+CONFIG_SOURCE_FIELDS = {
+    'functions': 'content_file',
+    'tools': 'content_file',
+    'pipelines': 'file',
+}
+
+# Fields accepted by the model update endpoint; the rest of a fetched model
+# (owner, timestamps, user) is set by the server
+MODEL_UPDATE_FIELDS = ("id", "base_model_id", "name", "meta", "params", "access_control", "is_active")
+
+# Fields of a model's meta.knowledge entries: required ones, then optional
+# ones with the value used when the knowledge base doesn't have them
+KNOWLEDGE_ITEM_REQUIRED = ("id", "user_id", "name", "created_at", "updated_at")
+KNOWLEDGE_ITEM_DEFAULTS = (
+    ("description", ""),
+    ("data", {"file_ids": []}),
+    ("meta", None),
+    ("access_control", None),
+    ("user", {}),
+    ("files", []),
+)
+
+def json_dumps(obj):
+    """Serialize a request body to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def json_loads(content):
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def response_json(response):
+    """Parse a response's JSON body once, caching the result on the response"""
+    try:
+        return response._parsed_json
+    except AttributeError:
+        response._parsed_json = json_loads(response.content)
+        return response._parsed_json
 
 class APIClient:
-    def __init__(self, base_url):
+    def __init__(self, base_url, max_workers=8):
         self.base_url = base_url
         self.session = requests.Session()
         self.token = None
+        # Number of independent requests allowed in flight at once (see map)
+        self.max_workers = max_workers
+        self._etag_lock = threading.Lock()
+        self._etag_cache = self._load_etag_cache()
+        self._etag_cache_dirty = False
+        # Knowledge base name -> id, filled on first lookup (see get_knowledge_id)
+        self._knowledge_ids = None
+        self._knowledge_lock = threading.Lock()
+        # Last fetched knowledge list, dropped whenever the client changes one
+        self._knowledge_list = None
+        # Model ID -> model as returned by its create request (see create_model)
+        self._created_models = {}
         
-        # Configure retry strategy
+        # Configure retry strategy. Only idempotent reads are retried on error
+        # statuses, so a POST that failed mid-way is never silently re-sent
         retry_strategy = Retry(
             total=3,
-            backoff_factor=1,
+            backoff_factor=0.2,
             status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough pooled connections that concurrent requests (see map)
+        # reuse keep-alive sockets instead of opening and discarding extras
+        adapter = HTTPAdapter(max_retries=retry_strategy,
+                              pool_connections=32,
+                              pool_maxsize=max(32, max_workers))
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -36,6 +189,7 @@ class APIClient:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:140.0) Gecko/20100101 Firefox/140.0",
             "Accept": "application/json",
             "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Origin": base_url,
             "Connection": "keep-alive"
         })
@@ -48,11 +202,31 @@ class APIClient:
         })
         self.session.cookies.set("token", token)
     
+    def map(self, func, items):
+        """Call func on each item concurrently, returning results in order.
+        
+        Requests are I/O bound, so items are spread over a thread pool that
+        shares this client's session and its keep-alive connections. An
+        exception raised for an item is returned in its place.
+        """
+        def call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+        
+        items = list(items)
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(call, items))
+    
     def _parse_json_response(self, response, endpoint=""):
         """Safely parse JSON response, handling various edge cases"""
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return response_json(response)
+        except ValueError:
             # For successful status codes with no/invalid JSON body
             if response.status_code in [200, 201, 204]:
                 # Some endpoints return empty success responses
@@ -82,6 +256,8 @@ class APIClient:
         # Only set Content-Type for JSON requests, not for multipart/form-data
         if json_data is not None and files is None:
             headers["Content-Type"] = "application/json"
+            data = json_dumps(json_data)
+            json_data = None
         
         if extra_headers:
             headers.update(extra_headers)
@@ -93,7 +269,7 @@ class APIClient:
         if response.status_code not in [200, 201, 204]:
             error_msg = f"API request to {endpoint} failed with status {response.status_code}"
             try:
-                error_detail = response.json()
+                error_detail = response_json(response)
                 error_msg += f": {error_detail}"
             except:
                 # Only show text preview if it's not binary data
@@ -106,6 +282,61 @@ class APIClient:
         
         return response
     
+    def _load_etag_cache(self):
+        """Load the persisted ETag cache, starting empty if it is missing or unreadable"""
+        try:
+            with open(ETAG_CACHE_FILE, 'rb') as f:
+                cache = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # Drop entries for endpoints that are no longer cached
+        return {key: entry for key, entry in cache.items()
+                if key.endswith(ETAG_CACHED_ENDPOINTS)}
+    
+    def save_etag_cache(self):
+        """Persist the ETag cache if it changed during this run"""
+        with self._etag_lock:
+            if not self._etag_cache_dirty:
+                return
+            try:
+                ETAG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = ETAG_CACHE_FILE.with_suffix('.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(json_dumps(self._etag_cache))
+                os.replace(tmp_file, ETAG_CACHE_FILE)
+                self._etag_cache_dirty = False
+            except OSError:
+                # The cache is only an optimization
+                pass
+    
+    def get_json_cached(self, endpoint, extra_headers=None):
+        """GET an endpoint's parsed JSON, revalidating a cached copy with its ETag"""
+        url = f"{self.base_url}{endpoint}"
+        headers = dict(extra_headers) if extra_headers else {}
+        
+        cached = self._etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+        
+        response = self.get(endpoint, extra_headers=headers)
+        if response.status_code == 304:
+            # Unchanged since the last run
+            return json_loads(cached["body"])
+        
+        result = response_json(response)
+        etag = response.headers.get('ETag')
+        if etag and response.status_code == 200:
+            try:
+                body = response.content.decode('utf-8')
+            except UnicodeDecodeError:
+                return result
+            with self._etag_lock:
+                self._etag_cache[url] = {"etag": etag, "body": body}
+                self._etag_cache_dirty = True
+        return result
+    
     def get(self, endpoint, params=None, extra_headers=None):
         """Make a GET request with automatic error handling"""
         url = f"{self.base_url}{endpoint}"
@@ -116,11 +347,15 @@ class APIClient:
         
         response = self.session.get(url, params=params, headers=headers, timeout=30)
         
+        # Not Modified is only a success when the caller asked to revalidate
+        if response.status_code == 304 and "If-None-Match" in headers:
+            return response
+        
         # Check for success
         if response.status_code not in [200, 201, 204]:
             error_msg = f"API request to {endpoint} failed with status {response.status_code}"
             try:
-                error_detail = response.json()
+                error_detail = response_json(response)
                 error_msg += f": {error_detail}"
             except:
                 error_msg += f": {response.text}"
@@ -128,20 +363,75 @@ class APIClient:
         
         return response
 
-def wait_for_service(base_url, max_retries=60, delay=5):
-    """Wait for a service to become available"""
+class MultipartFileStream:
+    """Single-file multipart/form-data body that is read from disk as it is sent.
+    
+    requests' files= builds the whole multipart body in memory before sending.
+    Passing this object as data= instead lets the connection pull the body in
+    blocks, with a Content-Length known up front.
+    """
+    
+    def __init__(self, field_name, file_path, content_type='application/octet-stream'):
+        boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path).replace('"', '%22')
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode('utf-8')
+        tail = f"\r\n--{boundary}--\r\n".encode('utf-8')
+        
+        self._file = open(file_path, 'rb')
+        self._length = len(head) + os.fstat(self._file.fileno()).st_size + len(tail)
+        self._parts = [io.BytesIO(head), self._file, io.BytesIO(tail)]
+    
+    def __len__(self):
+        return self._length
+    
+    def read(self, size=-1):
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+def wait_for_service(base_url, max_retries=60, delay=5, max_backoff=1.0):
+    """Wait up to max_retries * delay seconds for a service to become available"""
     print(f"⏳ Waiting for service at {base_url} to become ready...")
     
     session = requests.Session()
+    # Refused connections go straight back to the polling loop below
     retry = Retry(
         total=3,
+        connect=0,
         backoff_factor=0.3,
         status_forcelist=[500, 502, 503, 504]
     )
     adapter = HTTPAdapter(max_retries=retry)
     session.mount('http://', adapter)
     
-    for attempt in range(max_retries):
+    # Poll with jittered exponential backoff capped at max_backoff, so a service
+    # that comes up is noticed within about a second
+    start = time.monotonic()
+    deadline = start + max_retries * delay
+    attempt = 0
+    while True:
         try:
             # Try to access the API endpoint
             response = session.get(f"{base_url}/api/v1/auths", timeout=5)
@@ -150,12 +440,29 @@ def wait_for_service(base_url, max_retries=60, delay=5):
                 return True
         except requests.exceptions.RequestException as e:
             if attempt % 10 == 0:  # Print status every 10 attempts
-                print(f"   Attempt {attempt + 1}/{max_retries}: Service not ready yet...")
+                print(f"   Attempt {attempt + 1} ({time.monotonic() - start:.0f}s): Service not ready yet...")
         
-        time.sleep(delay)
+        attempt += 1
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        backoff = min(max_backoff, 0.1 * 2 ** attempt)
+        time.sleep(min(remaining, random.uniform(backoff / 2, backoff)))
     
     raise Exception(f"Service at {base_url} failed to become ready after {max_retries * delay} seconds")
 
+def wait_for_services(base_urls, max_retries=60, delay=5):
+    """Wait for several services at once, so the total wait is the slowest one"""
+    base_urls = list(dict.fromkeys(base_urls))
+    if len(base_urls) == 1:
+        return wait_for_service(base_urls[0], max_retries, delay)
+    
+    with ThreadPoolExecutor(max_workers=len(base_urls)) as executor:
+        futures = [executor.submit(wait_for_service, url, max_retries, delay) for url in base_urls]
+        for future in futures:
+            future.result()
+    return True
+
 def load_config(config_file):
     """Load configuration from JSON file"""
     try:
@@ -168,6 +475,57 @@ def load_config(config_file):
         print(f"Error: Invalid JSON in configuration file: {e}")
         sys.exit(1)
 
+def validate_config(config):
+    """
+    Check a configuration for problems before setup starts.
+
+    Returns (errors, warnings). Errors would fail setup. Warnings are
+    references that the config doesn't define itself but that may already
+    exist on the server.
+    """
+    errors = []
+    warnings = []
+    
+    for key in ('base_url', 'credentials'):
+        if key not in config:
+            errors.append(f"missing '{key}'")
+    for key in ('email', 'password'):
+        if key not in config.get('credentials', {}):
+            errors.append(f"credentials: missing '{key}'")
+    
+    # Required fields, and source files that must exist
+    for section, fields in CONFIG_REQUIRED_FIELDS.items():
+        for i, item in enumerate(config.get(section, [])):
+            label = f"{section}[{i}] ({item.get('name', item.get('id', '?'))})"
+            for field in fields:
+                if field not in item:
+                    errors.append(f"{label}: missing '{field}'")
+            source = item.get(CONFIG_SOURCE_FIELDS.get(section))
+            if source and not os.path.isfile(source):
+                errors.append(f"{label}: file '{source}' not found")
+    
+    # References between sections. Anything not defined here may already be
+    # installed on the server, so these are only warnings
+    function_ids = {f.get('id') for f in config.get('functions', [])}
+    tool_ids = {t.get('id') for t in config.get('tools', [])}
+    knowledge_names = {k.get('name') for k in config.get('knowledge', [])}
+    model_ids = {m.get('id') for m in config.get('models', [])}
+    for model in config.get('models', []):
+        label = f"models ({model.get('name', model.get('id', '?'))})"
+        for key, known, kind in (('filter_ids', function_ids, 'function'),
+                                 ('toolIds', tool_ids, 'tool'),
+                                 ('knowledge_names', knowledge_names, 'knowledge base')):
+            for ref in model.get(key) or []:
+                if ref not in known:
+                    warnings.append(f"{label}: {kind} '{ref}' in {key} is not defined in the config")
+    for pipeline in config.get('pipelines', []):
+        for ref in pipeline.get('model_ids', []):
+            # "*" applies the pipeline to every model
+            if ref != '*' and ref not in model_ids:
+                warnings.append(f"pipelines ({pipeline.get('name', '?')}): model '{ref}' in model_ids is not defined in the config")
+    
+    return errors, warnings
+
 
 def configure_for_openai(config, api_key):
     """
@@ -209,11 +567,17 @@ def configure_for_openai(config, api_key):
     print(f"   ✓ OpenAI configuration complete")
     return config
 
+@functools.lru_cache(maxsize=256)
+def _read_file_cached(filepath, mtime_ns, size):
+    """Read a file; keyed on its mtime and size so edits invalidate the entry"""
+    with open(filepath, 'r') as f:
+        return f.read()
+
 def read_file_content(filepath):
-    """Read content from a file"""
+    """Read content from a file, reusing earlier reads while it is unchanged"""
     try:
-        with open(filepath, 'r') as f:
-            return f.read()
+        st = os.stat(filepath)
+        return _read_file_cached(filepath, st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         print(f"Warning: File '{filepath}' not found - skipping")
         return None
@@ -239,7 +603,7 @@ def authenticate(client, config, signup_first=True, max_retries=3, retry_delay=5
                     data["name"] = creds['name']
                 
                 response = client.post(endpoint, json_data=data,
-                                     extra_headers={"Accept": "*/*", "Priority": "u=0"})
+                                     extra_headers=ANY_PRIORITY_HEADERS)
                 
                 # Extract token from the set-cookie header
                 set_cookie = response.headers.get('set-cookie', '')
@@ -291,55 +655,32 @@ def configure_code_execution(client, config):
     }
     
     client.post("/api/v1/configs/code_execution", json_data=data,
-                extra_headers={"Priority": "u=0"})
+                extra_headers=PRIORITY_HEADERS)
     print("✓ Code execution configured")
 
-def configure_signups(client):
+def configure_signups(client, config):
     """Configure user signups - compatible with Open WebUI v0.7.2+"""
     print("\n📝 Configuring User Signups...")
 
-    # First, get current config to see what fields are required
-    try:
-        response = client.get("/api/v1/auths/admin/config", extra_headers={"Priority": "u=0"})
-        current_config = response.json()
-    except Exception as e:
-        print(f"   ⚠️  Could not get current config, using defaults: {e}")
-        current_config = {}
+    # Use the preserved fields from the config file if given, otherwise get
+    # the current config to see what fields are required
+    if 'admin_defaults' in config:
+        current_config = config['admin_defaults']
+    else:
+        try:
+            current_config = client.get_json_cached("/api/v1/auths/admin/config",
+                                                    extra_headers=PRIORITY_HEADERS)
+        except Exception as e:
+            print(f"   ⚠️  Could not get current config, using defaults: {e}")
+            current_config = {}
 
     # Build config with all required fields for Open WebUI v0.7.2+
-    data = {
-        "SHOW_ADMIN_DETAILS": True,
-        "WEBUI_URL": current_config.get("WEBUI_URL", ""),
-        "ENABLE_SIGNUP": True,
-        # API Key settings (v0.7.2 uses plural ENABLE_API_KEYS)
-        "ENABLE_API_KEY": True,
-        "ENABLE_API_KEYS": True,
-        "ENABLE_API_KEY_ENDPOINT_RESTRICTIONS": False,
-        "ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS": False,
-        "API_KEY_ALLOWED_ENDPOINTS": "",
-        "API_KEYS_ALLOWED_ENDPOINTS": "",
-        # User settings
-        "DEFAULT_USER_ROLE": "user",
-        "DEFAULT_GROUP_ID": current_config.get("DEFAULT_GROUP_ID", ""),
-        "JWT_EXPIRES_IN": "-1",  # No expiration
-        # Feature flags
-        "ENABLE_COMMUNITY_SHARING": False,
-        "ENABLE_MESSAGE_RATING": False,
-        "ENABLE_CHANNELS": current_config.get("ENABLE_CHANNELS", False),
-        "ENABLE_NOTES": current_config.get("ENABLE_NOTES", False),
-        "ENABLE_USER_WEBHOOKS": False,
-        "ENABLE_FOLDERS": current_config.get("ENABLE_FOLDERS", True),
-        "ENABLE_MEMORIES": current_config.get("ENABLE_MEMORIES", True),
-        "ENABLE_USER_STATUS": current_config.get("ENABLE_USER_STATUS", False),
-        # UI settings
-        "PENDING_USER_OVERLAY_TITLE": "",
-        "PENDING_USER_OVERLAY_CONTENT": "",
-        "RESPONSE_WATERMARK": "",
-    }
+    data = SIGNUPS_TEMPLATE.copy()
+    data.update({key: current_config.get(key, default) for key, default in SIGNUPS_PRESERVED})
 
     try:
         client.post("/api/v1/auths/admin/config", json_data=data,
-                    extra_headers={"Priority": "u=0"})
+                    extra_headers=PRIORITY_HEADERS)
         print("✓ Signups configured")
     except Exception as e:
         print(f"✗ Failed to configure signups: {e}")
@@ -355,23 +696,24 @@ def create_users(client, config):
         print("   ℹ️  No additional users to create")
         return 0
     
+    def create_user(user):
+        data = {
+            "name": user['name'],
+            "email": user['email'],
+            "password": user['password'],
+            "role": user.get('role', 'user')
+        }
+        
+        client.post("/api/v1/auths/add", json_data=data,
+                   extra_headers=PRIORITY_HEADERS)
+        print(f"✓ User '{user['name']}' ({user['email']}) created with role: {user.get('role', 'user')}")
+    
     created = 0
-    for user in users:
-        try:
-            data = {
-                "name": user['name'],
-                "email": user['email'],
-                "password": user['password'],
-                "role": user.get('role', 'user')
-            }
-            
-            client.post("/api/v1/auths/add", json_data=data,
-                       extra_headers={"Priority": "u=0"})
-            print(f"✓ User '{user['name']}' ({user['email']}) created with role: {user.get('role', 'user')}")
+    for user, result in zip(users, client.map(create_user, users)):
+        if isinstance(result, Exception):
+            print(f"✗ Failed to create user '{user['name']}': {result}")
+        else:
             created += 1
-            
-        except Exception as e:
-            print(f"✗ Failed to create user '{user['name']}': {e}")
     
     return created
 
@@ -392,16 +734,27 @@ def create_function(client, function_config):
         },
         "content": content
     }
+    enabled = function_config.get('enabled', True)
+    if enabled:
+        # Servers that accept this create the function already enabled
+        data["is_active"] = True
     
     # Create function
-    client.post("/api/v1/functions/create", json_data=data, 
-                extra_headers={"Priority": "u=4"})
+    response = client.post("/api/v1/functions/create", json_data=data, 
+                           extra_headers=LOW_PRIORITY_HEADERS)
     print(f"✓ Function '{function_config['name']}' created")
     
-    # Toggle if enabled
-    if function_config.get('enabled', True):
-        client.post(f"/api/v1/functions/id/{function_config['id']}/toggle", 
-                    extra_headers={"Priority": "u=0"})
+    # Toggle if enabled and the create didn't already activate it. The toggle
+    # flips the state, so it must be skipped when is_active was honoured.
+    if enabled:
+        try:
+            result = response_json(response)
+            is_active = isinstance(result, dict) and result.get('is_active') is True
+        except ValueError:
+            is_active = False
+        if not is_active:
+            client.post(f"/api/v1/functions/id/{function_config['id']}/toggle", 
+                        extra_headers=PRIORITY_HEADERS)
         print(f"✓ Function '{function_config['name']}' enabled")
     
     return True
@@ -428,7 +781,7 @@ def create_tool(client, tool_config):
     # Create tool
     try:
         client.post("/api/v1/tools/create", json_data=data, 
-                    extra_headers={"Priority": "u=0"})
+                    extra_headers=PRIORITY_HEADERS)
         print(f"✓ Tool '{tool_config['name']}' created")
         return True
     except Exception as e:
@@ -439,10 +792,17 @@ def create_tool(client, tool_config):
         raise
 
 def get_knowledge_list(client):
+    """Get the knowledge bases, reusing the last fetch until one is changed"""
+    knowledge_list = client._knowledge_list
+    if knowledge_list is None:
+        knowledge_list = fetch_knowledge_list(client)
+        client._knowledge_list = knowledge_list
+    return knowledge_list
+
+def fetch_knowledge_list(client):
     """Get list of existing knowledge bases - compatible with Open WebUI v0.7.2+"""
     try:
-        response = client.get("/api/v1/knowledge/", extra_headers={"Accept": "application/json"})
-        result = response.json()
+        result = client.get_json_cached("/api/v1/knowledge/", extra_headers=JSON_HEADERS)
 
         # Handle different API response formats
         if isinstance(result, list):
@@ -474,8 +834,9 @@ def create_knowledge(client, name, description, access_control=None):
 
     try:
         response = client.post("/api/v1/knowledge/create", json_data=data,
-                             extra_headers={"Priority": "u=0"})
-        result = response.json()
+                             extra_headers=PRIORITY_HEADERS)
+        client._knowledge_list = None
+        result = response_json(response)
 
         # Handle different response formats
         if isinstance(result, dict):
@@ -492,54 +853,44 @@ def create_knowledge(client, name, description, access_control=None):
 
 def get_knowledge_id(client, name):
     """Get knowledge ID by name, create if doesn't exist"""
-    knowledge_list = get_knowledge_list(client)
+    # Knowledge bases may be set up concurrently; hold the lock so a name is
+    # only ever looked up or created once
+    with client._knowledge_lock:
+        # Index the existing knowledge bases once per client
+        if client._knowledge_ids is None:
+            client._knowledge_ids = {}
+            for knowledge in get_knowledge_list(client):
+                # If the list contains strings, they might be IDs or names
+                if isinstance(knowledge, dict) and 'name' in knowledge:
+                    client._knowledge_ids.setdefault(knowledge['name'], knowledge.get('id'))
 
-    # Look for existing knowledge base
-    for knowledge in knowledge_list:
-        # Handle both dict and other formats
-        if isinstance(knowledge, dict):
-            if knowledge.get('name') == name:
-                return knowledge.get('id')
-        elif isinstance(knowledge, str):
-            # If the list contains strings, they might be IDs or names
-            continue
+        # Look for existing knowledge base
+        if name in client._knowledge_ids:
+            return client._knowledge_ids[name]
 
-    # Create new knowledge base if not found
-    print(f"   📚 Creating new knowledge base: {name}")
-    response = create_knowledge(client, name=name, description=name)
-    if response and isinstance(response, dict) and 'id' in response:
-        return response['id']
+        # Create new knowledge base if not found
+        print(f"   📚 Creating new knowledge base: {name}")
+        response = create_knowledge(client, name=name, description=name)
+        if response and isinstance(response, dict) and 'id' in response:
+            client._knowledge_ids[name] = response['id']
+            return response['id']
 
-    return None
+        return None
 
 def upload_file(client, file_path):
     """Upload a file to the system"""
     try:
-        with open(file_path, 'rb') as f:
-            files = {'file': (os.path.basename(file_path), f, 'application/octet-stream')}
-            
-            # Remove Content-Type and Accept-Encoding headers for multipart upload
-            original_content_type = client.session.headers.get('Content-Type')
-            original_accept_encoding = client.session.headers.get('Accept-Encoding')
+        with MultipartFileStream('file', file_path) as body:
+            # Drop Accept-Encoding for this request only. A None value removes the
+            # session default without mutating the session, which other upload
+            # threads are using concurrently.
+            response = client.post("/api/v1/files/", data=body,
+                                 extra_headers={"Accept": "application/json", "Priority": "u=0",
+                                                "Accept-Encoding": None,
+                                                "Content-Type": body.content_type})
             
-            if 'Content-Type' in client.session.headers:
-                del client.session.headers['Content-Type']
-            if 'Accept-Encoding' in client.session.headers:
-                del client.session.headers['Accept-Encoding']
-            
-            try:
-                response = client.post("/api/v1/files/", files=files,
-                                     extra_headers={"Accept": "application/json", "Priority": "u=0"})
-                
-                # Parse JSON response
-                return client._parse_json_response(response, "/api/v1/files/")
-                    
-            finally:
-                # Restore original headers if they existed
-                if original_content_type:
-                    client.session.headers['Content-Type'] = original_content_type
-                if original_accept_encoding:
-                    client.session.headers['Accept-Encoding'] = original_accept_encoding
+            # Parse JSON response
+            return client._parse_json_response(response, "/api/v1/files/")
                     
     except FileNotFoundError:
         print(f"   ⚠️  File not found: {file_path}")
@@ -554,7 +905,8 @@ def add_file_to_knowledge(client, knowledge_id, file_id):
     
     try:
         response = client.post(f"/api/v1/knowledge/{knowledge_id}/file/add", 
-                             json_data=data, extra_headers={"Priority": "u=0"})
+                             json_data=data, extra_headers=PRIORITY_HEADERS)
+        client._knowledge_list = None
         
         # Parse JSON response using helper
         return client._parse_json_response(response, f"/api/v1/knowledge/{knowledge_id}/file/add")
@@ -581,29 +933,33 @@ def create_rag(client, rag_config):
         print("   ℹ️  No files to upload")
         return True
     
-    uploaded_count = 0
-    for file_path in files:
+    def upload_and_add(file_path):
         print(f"   📄 Uploading file: {file_path}")
         
         # Upload file
         upload_response = upload_file(client, file_path)
         if not upload_response:
-            continue
+            return False
         
         file_id = upload_response.get('id')
         if not file_id:
             print(f"   ⚠️  No file ID returned for {file_path}")
-            continue
+            return False
         
         print(f"   ✓ File uploaded with ID: {file_id}")
         
         # Add file to knowledge base
         add_response = add_file_to_knowledge(client, knowledge_id, file_id)
         if add_response:
-            print(f"   ✓ File added to knowledge base")
-            uploaded_count += 1
-        else:
-            print(f"   ⚠️  Failed to add file to knowledge base")
+            print(f"   ✓ File {file_path} added to knowledge base")
+            return True
+        
+        print(f"   ⚠️  Failed to add file {file_path} to knowledge base")
+        return False
+    
+    # Knowledge bases are already set up concurrently by main, so files are
+    # uploaded one at a time to keep requests within the --workers limit
+    uploaded_count = sum(1 for file_path in files if upload_and_add(file_path) is True)
     
     print(f"   📊 Uploaded {uploaded_count}/{len(files)} files to RAG '{rag_config['name']}'")
     return uploaded_count > 0
@@ -618,14 +974,7 @@ def create_model(client, model_config):
         "description": model_config.get('description'),
         "suggestion_prompts": None,
         "tags": [],
-        "capabilities": model_config.get('capabilities', {
-            "vision": False,
-            "file_upload": False,
-            "web_search": False,
-            "image_generation": False,
-            "code_interpreter": False,
-            "citations": False
-        })
+        "capabilities": model_config.get('capabilities', DEFAULT_CAPABILITIES)
     }
     
     # Add filterIds if present
@@ -647,10 +996,19 @@ def create_model(client, model_config):
         "access_control": model_config.get('access_control', None),
     }
     
-    client.post("/api/v1/models/create", json_data=data, 
-                extra_headers={"Priority": "u=0"})
+    response = client.post("/api/v1/models/create", json_data=data, 
+                           extra_headers=PRIORITY_HEADERS)
     print(f"✓ Model '{model_config['name']}' created")
     
+    # Remember the created model so associating knowledge needn't fetch it again
+    try:
+        created = response_json(response)
+    except ValueError:
+        created = None
+    if isinstance(created, dict) and created.get('id') == model_config['id'] \
+            and 'meta' in created and 'params' in created:
+        client._created_models[model_config['id']] = created
+    
     # If model has tools, list them
     if 'toolIds' in model_config and model_config['toolIds']:
         print(f"   🔧 Tools enabled: {', '.join(model_config['toolIds'])}")
@@ -684,7 +1042,7 @@ def enable_pipelines(client, config):
             }
     
     client.post("/openai/config/update", json_data=data, 
-                extra_headers={"Priority": "u=0"})
+                extra_headers=PRIORITY_HEADERS)
     print("✓ OpenAI pipeline configured")
 
 def upload_pipeline(client, pipeline_config):
@@ -699,7 +1057,7 @@ def upload_pipeline(client, pipeline_config):
     pipeline_id = pipeline_config.get('id')
     if not pipeline_id:
         # Try to extract ID from the Python content
-        id_match = re.search(r'self\.id\s*=\s*["\']([^"\']+)["\']', content)
+        id_match = PIPELINE_ID_RE.search(content)
         if id_match:
             pipeline_id = id_match.group(1)
             print(f"   ℹ️  Detected pipeline ID from content: {pipeline_id}")
@@ -721,65 +1079,53 @@ def upload_pipeline(client, pipeline_config):
         'urlIdx': '0'
     }
     
-    # Important: Don't set Content-Type header - requests will set it automatically with boundary
-    # Remove Content-Type from session headers temporarily if it exists
-    original_content_type = client.session.headers.get('Content-Type')
-    if 'Content-Type' in client.session.headers:
-        del client.session.headers['Content-Type']
-    
     max_retries = 5  # Maximum number of retries
     retry_delay = 10  # Seconds between retries
     
-    try:
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = client.post("/api/v1/pipelines/upload", files=files, data=data,
-                            extra_headers={"Accept": "*/*", "Priority": "u=0"})
-                
-                print(f"✓ Pipeline '{pipeline_config['name']}' uploaded successfully")
-                
-                # Extract pipeline ID from response if not provided
-                if not pipeline_id and response:
-                    try:
-                        result = response.json()
-                        pipeline_id = result.get('id')
-                        if pipeline_id:
-                            pipeline_config['id'] = pipeline_id  # Update config with actual ID
-                    except:
-                        pass
-                
-                # Configure pipeline valves if model_ids are specified
-                # This should happen regardless of whether we had an ID originally
-                if pipeline_id and 'model_ids' in pipeline_config:
-                    # Make sure the config has the ID
-                    if 'id' not in pipeline_config:
-                        pipeline_config['id'] = pipeline_id
-                    configure_pipeline_valves(client, pipeline_config)
-                
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = client.post("/api/v1/pipelines/upload", files=files, data=data,
+                        extra_headers=MULTIPART_HEADERS)
+            
+            print(f"✓ Pipeline '{pipeline_config['name']}' uploaded successfully")
+            
+            # Extract pipeline ID from response if not provided
+            if not pipeline_id and response:
+                try:
+                    result = response_json(response)
+                    pipeline_id = result.get('id')
+                    if pipeline_id:
+                        pipeline_config['id'] = pipeline_id  # Update config with actual ID
+                except:
+                    pass
+            
+            # Configure pipeline valves if model_ids are specified
+            # This should happen regardless of whether we had an ID originally
+            if pipeline_id and 'model_ids' in pipeline_config:
+                # Make sure the config has the ID
+                if 'id' not in pipeline_config:
+                    pipeline_config['id'] = pipeline_id
+                configure_pipeline_valves(client, pipeline_config)
+            
+            return True
+            
+        except Exception as e:
+            # If pipeline already exists, try to just configure valves
+            if "already exists" in str(e) and 'id' in pipeline_config and 'model_ids' in pipeline_config:
+                print(f"   ℹ️  Pipeline already exists, configuring valves...")
+                configure_pipeline_valves(client, pipeline_config)
                 return True
-                
-            except Exception as e:
-                # If pipeline already exists, try to just configure valves
-                if "already exists" in str(e) and 'id' in pipeline_config and 'model_ids' in pipeline_config:
-                    print(f"   ℹ️  Pipeline already exists, configuring valves...")
-                    configure_pipeline_valves(client, pipeline_config)
-                    return True
-                
-                # For other errors, retry if we haven't exhausted attempts
-                if attempt < max_retries:
-                    print(f"   ⚠️  Upload failed (attempt {attempt}/{max_retries}): {e}")
-                    print(f"   🔄 Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    print(f"   ❌ Upload failed after {max_retries} attempts: {e}")
-                    raise
-        
-        return False
-        
-    finally:
-        # Restore original Content-Type if it existed
-        if original_content_type:
-            client.session.headers['Content-Type'] = original_content_type
+            
+            # For other errors, retry if we haven't exhausted attempts
+            if attempt < max_retries:
+                print(f"   ⚠️  Upload failed (attempt {attempt}/{max_retries}): {e}")
+                print(f"   🔄 Retrying in {retry_delay} seconds...")
+                time.sleep(retry_delay)
+            else:
+                print(f"   ❌ Upload failed after {max_retries} attempts: {e}")
+                raise
+    
+    return False
 
 def configure_pipeline_valves(client, pipeline_config):
     """Configure pipeline valves to tie pipeline to specific models"""
@@ -791,86 +1137,108 @@ def configure_pipeline_valves(client, pipeline_config):
     }
     
     client.post(f"/api/v1/pipelines/{pipeline_config['id']}/valves/update?urlIdx=0", 
-                json_data=data, extra_headers={"Priority": "u=0"})
+                json_data=data, extra_headers=PRIORITY_HEADERS)
     print(f"   ✓ Pipeline tied to models: {', '.join(pipeline_config['model_ids'])}")
 
 
-def associate_knowledge_with_models(client, config):
+def build_knowledge_item(knowledge):
+    """Build a model's meta.knowledge entry for a knowledge base"""
+    item = {key: knowledge[key] for key in KNOWLEDGE_ITEM_REQUIRED}
+    for key, default in KNOWLEDGE_ITEM_DEFAULTS:
+        item[key] = knowledge.get(key, default)
+    item["type"] = "collection"
+    return item
+
+def get_models_by_id(client):
+    """Get all workspace models in one request, keyed by ID"""
+    try:
+        response = client.get("/api/v1/models/", extra_headers=LOW_PRIORITY_HEADERS)
+        result = client._parse_json_response(response, "/api/v1/models/")
+    except Exception as e:
+        print(f"   ⚠️  Failed to get model list: {e}")
+        return {}
+
+    # Newer versions may wrap the list like the knowledge endpoint does
+    if isinstance(result, dict):
+        result = result.get('items') or result.get('data') or []
+    if not isinstance(result, list):
+        return {}
+
+    # Only keep complete entries, since they are posted back as the update body
+    return {m['id']: m for m in result
+            if isinstance(m, dict) and 'id' in m and 'meta' in m and 'params' in m}
+
+def associate_knowledge_with_models(client, config, models_with_knowledge=None):
     """Associate knowledge bases with models that need them - compatible with Open WebUI v0.7.2+"""
 
+    # Find models that need knowledge bases, unless the caller already has them
+    if models_with_knowledge is None:
+        models_with_knowledge = [m for m in config.get('models', []) if 'knowledge_names' in m]
+    
+    if not models_with_knowledge:
+        print("   ℹ️  No models require knowledge base associations")
+        return 0
+
     # Get list of all knowledge bases
     knowledge_list = get_knowledge_list(client)
 
-    # Build knowledge map, handling different formats
-    knowledge_map = {}
-    for k in knowledge_list:
-        if isinstance(k, dict) and 'name' in k:
-            knowledge_map[k['name']] = k
-        elif isinstance(k, str):
-            # Skip strings - they're likely IDs not full objects
-            continue
+    # Build knowledge map, skipping strings - they're likely IDs not full objects
+    knowledge_map = {k['name']: k for k in knowledge_list if isinstance(k, dict) and 'name' in k}
     
-    # Find models that need knowledge bases
-    models_with_knowledge = []
-    for model in config.get('models', []):
-        if 'knowledge_names' in model:
-            models_with_knowledge.append(model)
+    # Start from the models created by this run; if several others still need
+    # fetching, one list request replaces a GET per model
+    models_by_id = dict(client._created_models)
+    if sum(1 for m in models_with_knowledge if m['id'] not in models_by_id) > 1:
+        models_by_id = {**get_models_by_id(client), **models_by_id}
     
-    if not models_with_knowledge:
-        print("   ℹ️  No models require knowledge base associations")
-        return 0
+    # Models sharing a knowledge base reuse the same entry
+    knowledge_items_by_name = {}
     
-    associated = 0
-    for model in models_with_knowledge:
-        try:
-            print(f"\n   📚 Updating model '{model['name']}' with knowledge bases...")
-            
-            # Get current model data
+    def associate(model):
+        print(f"\n   📚 Updating model '{model['name']}' with knowledge bases...")
+        
+        # Get current model data, unless it is already known
+        model_data = models_by_id.get(model['id'])
+        if model_data is None:
             response = client.get(f"/api/v1/models/model?id={model['id']}", 
-                                extra_headers={"Priority": "u=4"})
+                                extra_headers=LOW_PRIORITY_HEADERS)
             model_data = client._parse_json_response(response, f"/api/v1/models/model?id={model['id']}")
+        
+        # Build knowledge array
+        knowledge_items = []
+        for knowledge_name in model['knowledge_names']:
+            if knowledge_name in knowledge_map:
+                knowledge_item = knowledge_items_by_name.get(knowledge_name)
+                if knowledge_item is None:
+                    knowledge_item = knowledge_items_by_name.setdefault(
+                        knowledge_name, build_knowledge_item(knowledge_map[knowledge_name]))
+                knowledge_items.append(knowledge_item)
+                print(f"      ✓ Found knowledge base: {knowledge_name}")
+            else:
+                print(f"      ⚠️  Knowledge base not found: {knowledge_name}")
+        
+        if knowledge_items:
+            # Update model meta with knowledge
+            model_data.setdefault('meta', {})['knowledge'] = knowledge_items
             
-            # Build knowledge array
-            knowledge_items = []
-            for knowledge_name in model['knowledge_names']:
-                if knowledge_name in knowledge_map:
-                    knowledge = knowledge_map[knowledge_name]
-                    # Build knowledge item with required fields
-                    knowledge_item = {
-                        "id": knowledge['id'],
-                        "user_id": knowledge['user_id'],
-                        "name": knowledge['name'],
-                        "description": knowledge.get('description', ''),
-                        "data": knowledge.get('data', {"file_ids": []}),
-                        "meta": knowledge.get('meta', None),
-                        "access_control": knowledge.get('access_control', None),
-                        "created_at": knowledge['created_at'],
-                        "updated_at": knowledge['updated_at'],
-                        "user": knowledge.get('user', {}),
-                        "files": knowledge.get('files', []),
-                        "type": "collection"
-                    }
-                    knowledge_items.append(knowledge_item)
-                    print(f"      ✓ Found knowledge base: {knowledge_name}")
-                else:
-                    print(f"      ⚠️  Knowledge base not found: {knowledge_name}")
-            
-            if knowledge_items:
-                # Update model meta with knowledge
-                if 'meta' not in model_data:
-                    model_data['meta'] = {}
-                model_data['meta']['knowledge'] = knowledge_items
-                
-                # Send update request
-                update_response = client.post(f"/api/v1/models/model/update?id={model['id']}", 
-                                            json_data=model_data,
-                                            extra_headers={"Priority": "u=0"})
-                
-                print(f"   ✓ Model '{model['name']}' updated with {len(knowledge_items)} knowledge base(s)")
-                associated += 1
+            # Send update request with only the fields the update accepts
+            update_data = {key: model_data[key] for key in MODEL_UPDATE_FIELDS if key in model_data}
+            update_response = client.post(f"/api/v1/models/model/update?id={model['id']}", 
+                                        json_data=update_data,
+                                        extra_headers=PRIORITY_HEADERS)
             
-        except Exception as e:
-            print(f"   ✗ Failed to associate knowledge with model '{model['name']}': {e}")
+            print(f"   ✓ Model '{model['name']}' updated with {len(knowledge_items)} knowledge base(s)")
+            return True
+        
+        return False
+    
+    # Models are independent, so update them concurrently
+    associated = 0
+    for model, result in zip(models_with_knowledge, client.map(associate, models_with_knowledge)):
+        if isinstance(result, Exception):
+            print(f"   ✗ Failed to associate knowledge with model '{model['name']}': {result}")
+        elif result:
+            associated += 1
     
     return associated
 
@@ -880,13 +1248,23 @@ def main():
     parser = argparse.ArgumentParser(description='CTF Web API Automation Script')
     parser.add_argument('-c', '--config', default='ctf_config.json', 
                        help='Configuration file path (default: ctf_config.json)')
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                       help='Maximum concurrent API requests for bulk creates (default: 8)')
     args = parser.parse_args()
     
     print("🏁 CTF Challenge Setup Script")
     print("============================\n")
 
-    # Load configuration
+    # Load configuration, and reject it before making any requests if it is broken
     config = load_config(args.config)
+    errors, warnings = validate_config(config)
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    if errors:
+        print("✗ Invalid configuration:")
+        for error in errors:
+            print(f"   - {error}")
+        sys.exit(1)
 
     # Check for OpenAI API key - first from file, then environment variable
     openai_api_key = None
@@ -910,15 +1288,15 @@ def main():
     else:
         print("\n📦 Using Ollama with llama3.1:8b (no OpenAI API key found)")
 
-    # Wait for service to be ready
+    # Wait for services to be ready
     try:
-        wait_for_service(config['base_url'])
+        wait_for_services([config['base_url'], *config.get('wait_for', [])])
     except Exception as e:
         print(f"✗ Service failed to become ready: {e}")
         sys.exit(1)
     
     # Create API client
-    client = APIClient(config['base_url'])
+    client = APIClient(config['base_url'], max_workers=args.workers)
     
     # Track statistics
     stats = {
@@ -930,6 +1308,9 @@ def main():
         'knowledge': 0,
         'knowledge_associations': 0
     }
+    # Number of each component in the config, for the summary and exit status
+    expected = {key: len(config.get(key, [])) for key in
+                ('functions', 'tools', 'models', 'pipelines', 'users', 'knowledge')}
     
     # Step 1: Authenticate
     try:
@@ -940,64 +1321,81 @@ def main():
         print(f"✗ Failed to authenticate: {e}")
         sys.exit(1)
 
-    # Step 2: Configure code execution
-    if config.get('code_execution_config'):
-        try:
-            configure_code_execution(client, config)
-        except Exception as e:
-            print(f"✗ Failed to configure code execution: {e}")
-
-    # Step 3: Create additional users and configure signups
-    print("\n👥 Configuring Users and Signups")
-    if config.get('users'):
-        stats['users'] = create_users(client, config)
-    configure_signups(client)
+    # Steps 2-3 update independent admin settings, so the two config
+    # posts run in the background while users are created
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Step 2: Configure code execution
+        code_execution = None
+        if config.get('code_execution_config'):
+            code_execution = executor.submit(configure_code_execution, client, config)
+        
+        # Step 3: Create additional users and configure signups
+        print("\n👥 Configuring Users and Signups")
+        signups = executor.submit(configure_signups, client, config)
+        if config.get('users'):
+            stats['users'] = create_users(client, config)
+        
+        if code_execution:
+            try:
+                code_execution.result()
+            except Exception as e:
+                print(f"✗ Failed to configure code execution: {e}")
+        signups.result()
 
     # Step 4: Create all functions
     print("\n📂 Creating Functions")
     print("-------------------")
-    for func in config.get('functions', []):
-        try:
-            if create_function(client, func):
-                stats['functions'] += 1
-        except Exception as e:
-            print(f"✗ Failed to create function '{func['name']}': {e}")
+    functions = config.get('functions', [])
+    for func, result in zip(functions, client.map(lambda f: create_function(client, f), functions)):
+        if isinstance(result, Exception):
+            print(f"✗ Failed to create function '{func['name']}': {result}")
+        elif result:
+            stats['functions'] += 1
     
     # Step 5: Create all tools
     print("\n🔧 Creating Tools")
     print("---------------")
-    for tool in config.get('tools', []):
-        try:
-            if create_tool(client, tool):
-                stats['tools'] += 1
-        except Exception as e:
-            print(f"✗ Failed to create tool '{tool['name']}': {e}")
+    tools = config.get('tools', [])
+    for tool, result in zip(tools, client.map(lambda t: create_tool(client, t), tools)):
+        if isinstance(result, Exception):
+            print(f"✗ Failed to create tool '{tool['name']}': {result}")
+        elif result:
+            stats['tools'] += 1
 
     # Step 6: Create RAG
     print("\n📚 Creating RAG Knowledge Bases")
     print("------------------------------")
-    for knowledge in config.get('knowledge', []):
-        try:
-            if create_rag(client, knowledge):
-                stats['knowledge'] += 1
-        except Exception as e:
-            print(f"✗ Failed to create RAG '{knowledge['name']}': {e}")
+    knowledge_bases = config.get('knowledge', [])
+    for knowledge, result in zip(knowledge_bases, client.map(lambda k: create_rag(client, k), knowledge_bases)):
+        if isinstance(result, Exception):
+            print(f"✗ Failed to create RAG '{knowledge['name']}': {result}")
+        elif result:
+            stats['knowledge'] += 1
     
     # Step 7: Create all models
     print("\n🤖 Creating Models")
     print("----------------")
-    for model in config.get('models', []):
-        try:
-            if create_model(client, model):
-                stats['models'] += 1
-        except Exception as e:
-            print(f"✗ Failed to create model '{model['name']}': {e}")
+    models = config.get('models', [])
+    for model, result in zip(models, client.map(lambda m: create_model(client, m), models)):
+        if isinstance(result, Exception):
+            print(f"✗ Failed to create model '{model['name']}': {result}")
+        elif result:
+            stats['models'] += 1
+    
+    # Group the models needed by the association step and the summary in one pass
+    models_with_knowledge = []
+    models_with_tools = []
+    for model in models:
+        if 'knowledge_names' in model:
+            models_with_knowledge.append(model)
+        if model.get('toolIds'):
+            models_with_tools.append(model)
     
     # Step 8: Associate knowledge bases with models
     print("\n🔗 Associating Knowledge Bases with Models")
     print("----------------------------------------")
-    if any('knowledge_names' in model for model in config.get('models', [])):
-        stats['knowledge_associations'] = associate_knowledge_with_models(client, config)
+    if models_with_knowledge:
+        stats['knowledge_associations'] = associate_knowledge_with_models(client, config, models_with_knowledge)
     
     # Step 9: Enable pipelines configuration
     if config.get('pipelines_config'):
@@ -1006,53 +1404,54 @@ def main():
         enable_pipelines(client, config)
 
     # Step 10: Upload pipelines
-    if config.get('pipelines'):
+    pipelines = config.get('pipelines', [])
+    if pipelines:
         print("\n🚀 Uploading Pipelines")
         print("--------------------")
-        for pipeline in config.get('pipelines', []):
+        for pipeline in pipelines:
             try:
                 if upload_pipeline(client, pipeline):
                     stats['pipelines'] += 1
             except Exception as e:
                 print(f"✗ Failed to upload pipeline '{pipeline['name']}': {e}")
 
+    # Written once per run rather than on every cached response
+    client.save_etag_cache()
+
     # Summary
     print("\n✅ CTF setup completed!")
     print("\n📊 Summary:")
-    print(f"   - Users created: {stats['users']}/{len(config.get('users', []))}")
-    print(f"   - Functions created: {stats['functions']}/{len(config.get('functions', []))}")
-    print(f"   - Tools created: {stats['tools']}/{len(config.get('tools', []))}")
-    print(f"   - Knowledge bases created: {stats['knowledge']}/{len(config.get('knowledge', []))}")
-    print(f"   - Models created: {stats['models']}/{len(config.get('models', []))}")
+    print(f"   - Users created: {stats['users']}/{expected['users']}")
+    print(f"   - Functions created: {stats['functions']}/{expected['functions']}")
+    print(f"   - Tools created: {stats['tools']}/{expected['tools']}")
+    print(f"   - Knowledge bases created: {stats['knowledge']}/{expected['knowledge']}")
+    print(f"   - Models created: {stats['models']}/{expected['models']}")
     if stats['knowledge_associations'] > 0:
         print(f"   - Knowledge associations: {stats['knowledge_associations']}")
-    print(f"   - Pipelines uploaded: {stats['pipelines']}/{len(config.get('pipelines', []))}")
+    print(f"   - Pipelines uploaded: {stats['pipelines']}/{expected['pipelines']}")
     
     # Show pipeline-model associations
-    if config.get('pipelines'):
+    if pipelines:
         print("\n🔗 Pipeline-Model Associations:")
-        for pipeline in config.get('pipelines', []):
+        for pipeline in pipelines:
             if 'model_ids' in pipeline:
                 print(f"   - {pipeline['name']} → {', '.join(pipeline['model_ids'])}")
     
     # Show model-tool associations
-    models_with_tools = [m for m in config.get('models', []) if 'toolIds' in m and m['toolIds']]
     if models_with_tools:
         print("\n🔧 Model-Tool Associations:")
         for model in models_with_tools:
             print(f"   - {model['name']} → {', '.join(model['toolIds'])}")
     
     # Show model-knowledge associations
-    models_with_knowledge = [m for m in config.get('models', []) if 'knowledge_names' in m]
     if models_with_knowledge:
         print("\n📚 Model-Knowledge Associations:")
         for model in models_with_knowledge:
             print(f"   - {model['name']} → {', '.join(model['knowledge_names'])}")
     
     # Exit with error if any components failed
-    total_expected = len(config.get('functions', [])) + len(config.get('tools', [])) + len(config.get('models', [])) + len(config.get('pipelines', [])) + len(config.get('knowledge', []))
-    total_created = stats['functions'] + stats['tools'] + stats['models'] + stats['pipelines'] + stats['knowledge']
-    if total_created < total_expected:
+    components = ('functions', 'tools', 'models', 'pipelines', 'knowledge')
+    if sum(stats[key] for key in components) < sum(expected[key] for key in components):
         sys.exit(1)
 
 if __name__ == "__main__":